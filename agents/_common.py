@@ -0,0 +1,56 @@
+"""
+Shared Agent Setup Module
+
+Performs the one-time setup every agent module needs: putting the project
+root on sys.path, loading .env, and defining the Gemini model identifier.
+Importing this once per process replaces each agent module repeating its
+own sys.path.append / load_dotenv at import time.
+
+Author: Ishan
+Course: Google-Kaggle 5-Day AI Agents Intensive Course (Capstone Project)
+Date: December 2025
+"""
+
+import atexit
+import logging
+import os
+import queue
+import sys
+from logging.handlers import QueueHandler, QueueListener
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# Gemini model shared by all agents
+GEMINI_MODEL_ID = "gemini-2.5-flash"
+
+
+def _configure_agent_logging():
+    """
+    Route agent status messages through a queue-backed logger.
+
+    Log records are handed to a background listener thread, so coroutines
+    running concurrently don't serialize on the stdout lock the way direct
+    print calls do. Idempotent: only the first import installs handlers.
+    """
+    package_logger = logging.getLogger("agents")
+    if package_logger.handlers:
+        return
+
+    log_queue = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter("%(message)s"))
+
+    listener = QueueListener(log_queue, stream_handler)
+    listener.start()
+    atexit.register(listener.stop)
+
+    package_logger.addHandler(QueueHandler(log_queue))
+    package_logger.setLevel(logging.INFO)
+    package_logger.propagate = False
+
+
+_configure_agent_logging()
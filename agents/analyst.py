@@ -15,74 +15,272 @@ Course: Google-Kaggle 5-Day AI Agents Intensive Course (Capstone Project)
 Date: November 2025
 """
 
-import os
-from api_config import GOOGLE_API_KEY
-from google import genai
+import asyncio
+import logging
+import re
+
+from agents._common import GEMINI_MODEL_ID
 from google.genai import types
-from dotenv import load_dotenv
-import sys
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from utils.tools import search_pricing_info
+from utils.llm_cache import get_cached_response, store_response
+from utils.gemini_client import get_client, call_with_retry_async, run_async
+
+logger = logging.getLogger(__name__)
+
+# Matches the entry headers of the researcher's competitor list. The
+# model usually emits one-liners ("1. **Microsoft Teams**: A chat
+# platform" / "- **Coda** - doc tool"), where the name ends at the
+# colon/dash separator; multi-line entries put the name alone on the
+# list line, and their indented detail lines ("   Pricing: free")
+# contain a colon and are skipped
+_COMPETITOR_LINE_RE = re.compile(
+    # Top-level entry: captured name, optional ": desc" / "- desc" tail
+    r'^(?:\d+\.|[-*])\s*\**([A-Za-z0-9][^:*\n]+?)\**\s*(?:[:–—-]\s.*)?$'
+    # Indented entry header: name only; colon-bearing detail lines never match
+    r'|^\s+(?:\d+\.\s*|[-*]\s+)\**([A-Za-z0-9][^:\n*]*?)\**\s*$',
+    re.MULTILINE)
+
+
+def extract_competitor_names(competitors_data: dict, limit: int = 2) -> list:
+    """
+    Pull competitor company names out of the researcher's formatted list.
+
+    The 'identified_competitors' field is model-formatted text, not a
+    structured list; this grabs the numbered/bulleted entry headers so
+    callers can hand real competitor names to the pricing analysis
+    instead of passing the target company as its own competitor.
+
+    Args:
+        competitors_data (dict): Competitor research data with an
+            'identified_competitors' text field
+        limit (int): Maximum number of names to return (default 2,
+            matching the pricing analysis competitor cap)
+
+    Returns:
+        list: Up to `limit` competitor names, possibly empty
+
+    Example:
+        >>> extract_competitor_names({'identified_competitors': '1. Coda\\n2. Airtable'})
+        ['Coda', 'Airtable']
+    """
+    text = competitors_data.get('identified_competitors', '') if competitors_data else ''
+    names = []
+    for match in _COMPETITOR_LINE_RE.finditer(text):
+        name = (match.group(1) or match.group(2)).strip()
+        if name and name not in names:
+            names.append(name)
+        if len(names) >= limit:
+            break
+    return names
+
+
+# gemini-2.5-flash rejects context caches below ~4096 tokens, so for
+# summaries clearly under that (≈4 chars per token) the create call is a
+# guaranteed-to-fail round trip and is skipped outright
+_SUMMARY_CACHE_MIN_TOKENS = 4096
+
+
+# Prompt scaffolding hoisted to module scope: the constant text is built and
+# interned once, and each call only allocates the filled-in result. The
+# static instructions lead and the per-company data trails, so calls share
+# an identical prefix that provider-side prompt caching can match on.
+_COMPETITION_PROMPT = """
+You are a business analyst. Perform a competitive analysis of the target
+company described in the data below, covering:
+
+1. **Market Position**: Where does the target company stand relative to competitors?
+
+2. **Competitive Advantages**: What are the target company's unique strengths?
+
+3. **Competitive Disadvantages**: Where do competitors have an edge?
+
+4. **Feature Comparison**: Compare key features/offerings across competitors
+
+5. **Target Audience Overlap**: How similar are the target markets?
+
+Be specific and data-driven. Use the information provided.
+
+TARGET COMPANY: {company_name}
+{summary}
+
+COMPETITORS:
+{competitors}
+"""
+
+_SWOT_PROMPT = """
+Generate a comprehensive SWOT analysis of the company described in the
+data below:
+
+**STRENGTHS:**
+- List 4-5 key strengths
+
+**WEAKNESSES:**
+- List 4-5 key weaknesses
+
+**OPPORTUNITIES:**
+- List 4-5 market opportunities
+
+**THREATS:**
+- List 4-5 threats from competition/market
+
+Be specific and actionable.
+
+COMPANY: {company_name}
+
+COMPANY OVERVIEW:
+{summary}
+
+COMPETITIVE ANALYSIS:
+{competitive_analysis}
+"""
+
+# Variant used when the company overview is already in a Gemini context
+# cache from the preceding competitive-analysis call, so the summary
+# tokens are not resent or retokenized
+_SWOT_CACHED_PROMPT = """
+Using the cached company overview and the competitive analysis below,
+generate a comprehensive SWOT analysis:
+
+**STRENGTHS:**
+- List 4-5 key strengths
+
+**WEAKNESSES:**
+- List 4-5 key weaknesses
+
+**OPPORTUNITIES:**
+- List 4-5 market opportunities
+
+**THREATS:**
+- List 4-5 threats from competition/market
+
+Be specific and actionable.
+
+COMPANY: {company_name}
+
+COMPETITIVE ANALYSIS:
+{competitive_analysis}
+"""
+
+_PRICING_PROMPT = """
+Analyze the pricing strategy of the company based on the data below.
+Provide:
+1. Pricing positioning (premium/mid-tier/budget)
+2. Comparison with competitors
+3. Pricing strategy recommendations
+
+Keep it concise.
 
-load_dotenv()
+COMPANY: {company_name}
+
+Company Pricing:
+{company_pricing}
+
+Competitor Pricing:
+{competitor_pricing}
+"""
 
 
 class AnalystAgent:
     """
     Agent responsible for competitive analysis and strategic insights.
-    
+
     This agent uses Google's Gemini AI to perform comprehensive business
     analysis including competitive positioning, SWOT analysis, and pricing
     strategy evaluation. It synthesizes research data into actionable insights.
-    
+
+    The three analyses are exposed both as async methods (for concurrent
+    execution via analyze_all) and as sync wrappers with the original names
+    for existing callers. analyze_all overlaps the independent pricing call
+    with the competition -> SWOT chain, roughly halving end-to-end latency.
+
     Attributes:
         client (genai.Client): Google Generative AI client instance
         model_id (str): Gemini model identifier for AI analysis
-        
+
     Example:
         >>> analyst = AnalystAgent()
         >>> analysis = analyst.analyze_competition(company_data, competitors_data)
         >>> swot = analyst.generate_swot(company_data, analysis)
     """
-    
+
     def __init__(self):
         """
         Initialize the AnalystAgent with Gemini AI client.
-        
-        Sets up the Google Generative AI client using the API key from
-        environment variables and configures the Gemini model.
+
+        Uses the shared Gemini client so all agents reuse one HTTP
+        connection pool, and configures the Gemini model.
         """
-        self.client = genai.Client(api_key=GOOGLE_API_KEY)
-        self.model_id = "gemini-2.5-flash"
+        self.client = get_client()
+        self.model_id = GEMINI_MODEL_ID
 
-    def analyze_competition(self, company_data: dict, competitors_data: dict) -> dict:
+    async def _generate_text(self, prompt: str) -> str:
+        """
+        Generate text from Gemini with optional response caching.
+
+        Checks the exact-match disk cache (enabled via GEMINI_CACHE=1)
+        before issuing the API call, and stores fresh responses back.
+
+        Args:
+            prompt (str): Full prompt text
+
+        Returns:
+            str: Response text (cached or freshly generated)
+        """
+        cached = get_cached_response(self.model_id, prompt)
+        if cached is not None:
+            return cached
+
+        # Stream the response and join chunks, so callers that pass the
+        # text onward (file writes, downstream prompts) are not stuck
+        # waiting on a single monolithic response object
+        async def stream_once() -> str:
+            chunks = []
+            async for chunk in await self.client.aio.models.generate_content_stream(
+                model=self.model_id,
+                contents=prompt
+            ):
+                if chunk.text:
+                    chunks.append(chunk.text)
+            return "".join(chunks)
+
+        response_text = await call_with_retry_async(stream_once)
+
+        store_response(self.model_id, prompt, response_text)
+
+        return response_text
+
+    async def analyze_competition_async(self, company_data: dict, competitors_data: dict) -> dict:
         """
         Perform comprehensive competitive landscape analysis.
-        
+
         Analyzes the target company's position relative to competitors across
         multiple dimensions including market position, competitive advantages,
         disadvantages, feature comparison, and target audience overlap.
-        
+
         Args:
             company_data (dict): Research data for the target company.
                 Expected keys: 'company_name', 'summary'
             competitors_data (dict): Research data about competitors.
                 Expected keys: 'identified_competitors'
-                
+
         Returns:
             dict: Competitive analysis results with the following structure:
                 {
-                    'competitive_analysis': str  # Detailed analysis covering:
-                                                 # - Market Position
-                                                 # - Competitive Advantages
-                                                 # - Competitive Disadvantages
-                                                 # - Feature Comparison
-                                                 # - Target Audience Overlap
+                    'competitive_analysis': str,  # Detailed analysis covering:
+                                                  # - Market Position
+                                                  # - Competitive Advantages
+                                                  # - Competitive Disadvantages
+                                                  # - Feature Comparison
+                                                  # - Target Audience Overlap
+                    'summary_cache': str          # (optional) Name of the Gemini
+                                                  # context cache holding this
+                                                  # company's overview, consumed
+                                                  # by generate_swot_async
                 }
-                
+
         Raises:
             Exception: If AI analysis fails or data is insufficient
-            
+
         Example:
             >>> company_data = {
             ...     'company_name': 'Slack',
@@ -91,67 +289,83 @@ class AnalystAgent:
             >>> competitors_data = {
             ...     'identified_competitors': '1. Microsoft Teams...'
             ... }
-            >>> result = analyst.analyze_competition(company_data, competitors_data)
+            >>> result = await analyst.analyze_competition_async(company_data, competitors_data)
             >>> print(result['competitive_analysis'])
-            
+
         Note:
             Analysis is data-driven and specific based on provided research
         """
-        print(f"\n📊 Analyzing competitive landscape...")
-
-        company_name = company_data.get("company_name", "Unknown")
-
-        # Create analysis prompt
-        prompt = f"""
-You are a business analyst. Perform a competitive analysis based on this data:
-
-TARGET COMPANY: {company_name}
-{company_data.get('summary', 'No data available')}
-
-COMPETITORS:
-{competitors_data.get('identified_competitors', 'No competitors identified')}
-
-Provide a competitive analysis covering:
-
-1. **Market Position**: Where does {company_name} stand relative to competitors?
-
-2. **Competitive Advantages**: What are {company_name}'s unique strengths?
-
-3. **Competitive Disadvantages**: Where do competitors have an edge?
-
-4. **Feature Comparison**: Compare key features/offerings across competitors
+        logger.info("📊 Analyzing competitive landscape...")
+
+        prompt = self._build_competition_prompt(company_data, competitors_data)
+        summary = company_data.get('summary', 'No data available')
+
+        # Push the company overview into a short-lived Gemini context cache
+        # so generate_swot doesn't resend the same thousands of tokens.
+        # The create overlaps the competition call instead of blocking in
+        # front of it as an extra serial round trip, and summaries clearly
+        # below the cacheable minimum skip the attempt entirely. Best-effort
+        # either way. The cache name travels with this call's result rather
+        # than on self — one analyst instance serves several companies at
+        # once, so instance state would let company B's cache overwrite A's
+        # between A's competition and SWOT steps.
+        async def create_summary_cache():
+            if len(summary) // 4 < _SUMMARY_CACHE_MIN_TOKENS:
+                return None
+            try:
+                cache = await self.client.aio.caches.create(
+                    model=self.model_id,
+                    config=types.CreateCachedContentConfig(
+                        contents=[f"COMPANY OVERVIEW:\n{summary}"],
+                        ttl="600s"
+                    )
+                )
+                return cache.name
+            except Exception:
+                return None
+
+        analysis_text, summary_cache = await asyncio.gather(
+            self._generate_text(prompt),
+            create_summary_cache()
+        )
 
-5. **Target Audience Overlap**: How similar are the target markets?
+        analysis = {"competitive_analysis": analysis_text}
+        if summary_cache:
+            analysis["summary_cache"] = summary_cache
 
-Be specific and data-driven. Use the information provided.
-"""
+        logger.info("✅ Competitive analysis complete")
 
-        response = self.client.models.generate_content(
-            model=self.model_id,
-            contents=prompt
-        )
+        return analysis
 
-        analysis = {
-            "competitive_analysis": response.text
-        }
+    def analyze_competition(self, company_data: dict, competitors_data: dict) -> dict:
+        """
+        Sync wrapper around analyze_competition_async for existing callers.
 
-        print(f"✅ Competitive analysis complete")
+        Args:
+            company_data (dict): Research data for the target company
+            competitors_data (dict): Research data about competitors
 
-        return analysis
+        Returns:
+            dict: Competitive analysis results (see analyze_competition_async)
+        """
+        return run_async(self.analyze_competition_async(company_data, competitors_data))
 
-    def generate_swot(self, company_data: dict, competitive_analysis: dict) -> dict:
+    async def generate_swot_async(self, company_data: dict, competitive_analysis: dict) -> dict:
         """
         Generate comprehensive SWOT analysis for the target company.
-        
+
         Creates a structured SWOT (Strengths, Weaknesses, Opportunities, Threats)
         analysis based on company research and competitive analysis data.
-        
+
         Args:
             company_data (dict): Research data for the target company.
                 Expected keys: 'company_name', 'summary'
             competitive_analysis (dict): Results from competitive analysis.
-                Expected keys: 'competitive_analysis'
-                
+                Expected keys: 'competitive_analysis'; an optional
+                'summary_cache' entry (set by analyze_competition_async for
+                this same company) is popped and used to reference the
+                cached company overview
+
         Returns:
             dict: SWOT analysis with the following structure:
                 {
@@ -161,78 +375,90 @@ Be specific and data-driven. Use the information provided.
                                           # - 4-5 Opportunities
                                           # - 4-5 Threats
                 }
-                
+
         Raises:
             Exception: If AI analysis fails or data is insufficient
-            
+
         Example:
             >>> company_data = {'company_name': 'Netflix', 'summary': '...'}
             >>> competitive_analysis = {'competitive_analysis': '...'}
-            >>> swot = analyst.generate_swot(company_data, competitive_analysis)
+            >>> swot = await analyst.generate_swot_async(company_data, competitive_analysis)
             >>> print(swot['swot_analysis'])
-            
+
             **STRENGTHS:**
             - Market leader in streaming...
             - Strong original content library...
-            
+
         Note:
             Analysis is specific and actionable, not generic platitudes
         """
-        print(f"\n📋 Generating SWOT analysis...")
-
-        company_name = company_data.get("company_name", "Unknown")
-
-        prompt = f"""
-Based on this information about {company_name}:
-
-COMPANY OVERVIEW:
-{company_data.get('summary', 'No data available')}
-
-COMPETITIVE ANALYSIS:
-{competitive_analysis.get('competitive_analysis', 'No analysis available')}
-
-Generate a comprehensive SWOT analysis:
-
-**STRENGTHS:**
-- List 4-5 key strengths
-
-**WEAKNESSES:**
-- List 4-5 key weaknesses
-
-**OPPORTUNITIES:**
-- List 4-5 market opportunities
-
-**THREATS:**
-- List 4-5 threats from competition/market
-
-Be specific and actionable.
-"""
-
-        response = self.client.models.generate_content(
-            model=self.model_id,
-            contents=prompt
-        )
+        logger.info("📋 Generating SWOT analysis...")
+
+        swot_text = None
+
+        # Reuse the context cache created by the matching
+        # analyze_competition call, consumed from its result dict so
+        # concurrent companies can't pick up each other's overview.
+        # Popping also keeps the transient cache name out of downstream
+        # report cache keys. Falls back to the full prompt if the cache
+        # is absent or expired.
+        summary_cache = competitive_analysis.pop("summary_cache", None)
+        if summary_cache:
+            try:
+                response = await call_with_retry_async(
+                    lambda: self.client.aio.models.generate_content(
+                        model=self.model_id,
+                        contents=_SWOT_CACHED_PROMPT.format(
+                            company_name=company_data.get("company_name", "Unknown"),
+                            competitive_analysis=competitive_analysis.get(
+                                "competitive_analysis", "No analysis available")
+                        ),
+                        config=types.GenerateContentConfig(
+                            cached_content=summary_cache
+                        )
+                    )
+                )
+                swot_text = response.text
+            except Exception:
+                swot_text = None
+
+        if swot_text is None:
+            prompt = self._build_swot_prompt(company_data, competitive_analysis)
+            swot_text = await self._generate_text(prompt)
 
         swot = {
-            "swot_analysis": response.text
+            "swot_analysis": swot_text
         }
 
-        print(f"✅ SWOT analysis complete")
+        logger.info("✅ SWOT analysis complete")
 
         return swot
 
-    def analyze_pricing(self, company_name: str, competitors: list) -> dict:
+    def generate_swot(self, company_data: dict, competitive_analysis: dict) -> dict:
+        """
+        Sync wrapper around generate_swot_async for existing callers.
+
+        Args:
+            company_data (dict): Research data for the target company
+            competitive_analysis (dict): Results from competitive analysis
+
+        Returns:
+            dict: SWOT analysis results (see generate_swot_async)
+        """
+        return run_async(self.generate_swot_async(company_data, competitive_analysis))
+
+    async def analyze_pricing_async(self, company_name: str, competitors: list) -> dict:
         """
         Analyze pricing strategies and positioning.
-        
+
         Evaluates the target company's pricing strategy in comparison to
         competitors, providing insights on pricing positioning and strategic
         recommendations.
-        
+
         Args:
             company_name (str): Name of the target company
             competitors (list): List of competitor company names (max 2 analyzed)
-                
+
         Returns:
             dict: Pricing analysis with the following structure:
                 {
@@ -243,96 +469,202 @@ Be specific and actionable.
                                                   # - Competitor comparison
                                                   # - Strategy recommendations
                 }
-                
+
         Raises:
             Exception: If pricing search fails or AI analysis encounters error
-            
+
         Example:
-            >>> result = analyst.analyze_pricing("Notion", ["Coda", "Airtable"])
+            >>> result = await analyst.analyze_pricing_async("Notion", ["Coda", "Airtable"])
             >>> print(result['analysis'])
-            
+
             Pricing Positioning: Mid-tier/Premium...
             Comparison: More affordable than Coda but pricier than...
-            
+
         Note:
             - Limits competitor analysis to 2 companies to save API calls
             - Uses web search to gather current pricing information
         """
-        print(f"\n💰 Analyzing pricing strategies...")
-
-        # Search pricing for main company
-        company_pricing = search_pricing_info(company_name)
+        logger.info("💰 Analyzing pricing strategies...")
+
+        # Run all pricing searches concurrently; each is an independent
+        # blocking HTTP call (limit competitors to 2 to save API calls)
+        target_competitors = competitors[:2]
+        company_pricing, *competitor_results = await asyncio.gather(
+            self._search_pricing_async(company_name),
+            *[self._search_pricing_async(competitor) for competitor in target_competitors]
+        )
 
         pricing_data = {
             "company_pricing": company_pricing,
-            "competitor_pricing": []
+            "competitor_pricing": [
+                {"competitor": competitor, "results": comp_pricing}
+                for competitor, comp_pricing in zip(target_competitors, competitor_results)
+            ]
         }
 
-        # Search pricing for competitors (limit to 2 to save API calls)
-        for competitor in competitors[:2]:
-            comp_pricing = search_pricing_info(competitor)
-            pricing_data["competitor_pricing"].append({
-                "competitor": competitor,
-                "results": comp_pricing
-            })
-        
         # Analyze with Gemini
-        prompt = f"""
-Analyze the pricing strategy based on this data:
+        prompt = self._build_pricing_prompt(
+            company_name, company_pricing, pricing_data["competitor_pricing"]
+        )
 
-{company_name} Pricing:
-{self._format_pricing_results(company_pricing)}
+        pricing_data["analysis"] = await self._generate_text(prompt)
 
-Competitor Pricing:
-{self._format_competitor_pricing(pricing_data["competitor_pricing"])}
+        logger.info("✅ Pricing analysis complete")
 
-Provide:
-1. Pricing positioning (premium/mid-tier/budget)
-2. Comparison with competitors
-3. Pricing strategy recommendations
+        return pricing_data
 
-Keep it concise.
-"""
+    def analyze_pricing(self, company_name: str, competitors: list) -> dict:
+        """
+        Sync wrapper around analyze_pricing_async for existing callers.
+
+        Args:
+            company_name (str): Name of the target company
+            competitors (list): List of competitor company names
+
+        Returns:
+            dict: Pricing analysis results (see analyze_pricing_async)
+        """
+        return run_async(self.analyze_pricing_async(company_name, competitors))
+
+    async def _search_pricing_async(self, company_name: str) -> list:
+        """
+        Run a blocking pricing search in a worker thread.
+
+        Args:
+            company_name (str): Company to search pricing for
+
+        Returns:
+            list: Search results from search_pricing_info
+        """
+        return await asyncio.to_thread(search_pricing_info, company_name)
+
+    async def analyze_all(self, company_data: dict, competitors_data: dict, competitors: list) -> dict:
+        """
+        Run all three analyses with maximum concurrency.
+
+        The pricing analysis is independent of the competition -> SWOT chain,
+        so it runs concurrently with the competitive analysis via
+        asyncio.gather. The SWOT analysis then runs once the competitive
+        analysis it depends on is available.
+
+        Args:
+            company_data (dict): Research data for the target company.
+                Expected keys: 'company_name', 'summary'
+            competitors_data (dict): Research data about competitors.
+                Expected keys: 'identified_competitors'
+            competitors (list): List of competitor company names for pricing
+
+        Returns:
+            dict: Combined results with the following structure:
+                {
+                    'competitive_analysis': dict,  # From analyze_competition_async
+                    'swot_analysis': dict,         # From generate_swot_async
+                    'pricing_analysis': dict       # From analyze_pricing_async
+                }
+
+        Example:
+            >>> results = await analyst.analyze_all(company_data, competitors_data, ['Coda'])
+            >>> print(results['swot_analysis']['swot_analysis'])
+        """
+        company_name = company_data.get("company_name", "Unknown")
 
-        response = self.client.models.generate_content(
-            model=self.model_id,
-            contents=prompt
+        competitive_analysis, pricing_analysis = await asyncio.gather(
+            self.analyze_competition_async(company_data, competitors_data),
+            self.analyze_pricing_async(company_name, competitors)
         )
 
-        pricing_data["analysis"] = response.text
+        swot_analysis = await self.generate_swot_async(company_data, competitive_analysis)
 
-        print(f"✅ Pricing analysis complete")
+        return {
+            "competitive_analysis": competitive_analysis,
+            "swot_analysis": swot_analysis,
+            "pricing_analysis": pricing_analysis
+        }
 
-        return pricing_data
+    def _build_competition_prompt(self, company_data: dict, competitors_data: dict) -> str:
+        """
+        Build the competitive analysis prompt.
+
+        Shared between the direct async call path and the batch submission
+        path so both send identical prompts.
+
+        Args:
+            company_data (dict): Research data for the target company
+            competitors_data (dict): Research data about competitors
+
+        Returns:
+            str: Complete prompt for the competitive analysis call
+        """
+        return _COMPETITION_PROMPT.format(
+            company_name=company_data.get("company_name", "Unknown"),
+            summary=company_data.get("summary", "No data available"),
+            competitors=competitors_data.get("identified_competitors", "No competitors identified")
+        )
+
+    def _build_swot_prompt(self, company_data: dict, competitive_analysis: dict) -> str:
+        """
+        Build the SWOT analysis prompt.
+
+        Args:
+            company_data (dict): Research data for the target company
+            competitive_analysis (dict): Results from competitive analysis
+
+        Returns:
+            str: Complete prompt for the SWOT analysis call
+        """
+        return _SWOT_PROMPT.format(
+            company_name=company_data.get("company_name", "Unknown"),
+            summary=company_data.get("summary", "No data available"),
+            competitive_analysis=competitive_analysis.get("competitive_analysis", "No analysis available")
+        )
+
+    def _build_pricing_prompt(self, company_name: str, company_pricing: list,
+                              competitor_pricing: list) -> str:
+        """
+        Build the pricing analysis prompt from gathered search results.
+
+        Args:
+            company_name (str): Name of the target company
+            company_pricing (list): Pricing search results for the company
+            competitor_pricing (list): Per-competitor pricing result dicts
+
+        Returns:
+            str: Complete prompt for the pricing analysis call
+        """
+        return _PRICING_PROMPT.format(
+            company_name=company_name,
+            company_pricing=self._format_pricing_results(company_pricing),
+            competitor_pricing=self._format_competitor_pricing(competitor_pricing)
+        )
 
     def _format_pricing_results(self, results: list) -> str:
         """
         Format pricing search results for AI prompt.
-        
+
         Args:
             results (list): List of search result dictionaries
-            
+
         Returns:
             str: Formatted text with numbered results
         """
-        formatted = ""
+        parts = []
         for i, result in enumerate(results, 1):
-            formatted += f"{i}. {result.get('title', 'N/A')}\n"
-            formatted += f"   {result.get('snippet', 'N/A')}\n"
-        return formatted
+            g = result.get
+            parts.append(f"{i}. {g('title', 'N/A')}\n   {g('snippet', 'N/A')}\n")
+        return "".join(parts)
 
     def _format_competitor_pricing(self, comp_pricing: list) -> str:
         """
         Format competitor pricing data for AI prompt.
-        
+
         Args:
             comp_pricing (list): List of competitor pricing dictionaries
-            
+
         Returns:
             str: Formatted text with competitor names and pricing results
         """
-        formatted = ""
+        parts = []
         for item in comp_pricing:
-            formatted += f"\n{item.get('competitor', 'Unknown')}:\n"
-            formatted += self._format_pricing_results(item.get('results', []))
-        return formatted
\ No newline at end of file
+            parts.append(f"\n{item.get('competitor', 'Unknown')}:\n")
+            parts.append(self._format_pricing_results(item.get('results', [])))
+        return "".join(parts)
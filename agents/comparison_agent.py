@@ -14,136 +14,58 @@ Course: Google-Kaggle 5-Day AI Agents Intensive Course (Capstone Project)
 Date: November 2025
 """
 
-import os
-from api_config import GOOGLE_API_KEY
-from google import genai
+import asyncio
+import hashlib
+import logging
+import re
+import time
+from pathlib import Path
 from datetime import datetime
+from agents._common import GEMINI_MODEL_ID
+from agents.analyst import AnalystAgent, extract_competitor_names
+from utils.llm_cache import get_cached_response, store_response
+from utils.gemini_client import get_client, call_with_retry, run_async
 
+logger = logging.getLogger(__name__)
 
-class ComparisonAgent:
-    """
-    Agent responsible for multi-company comparative analysis.
-    
-    This agent takes analysis data from multiple companies and creates
-    comprehensive side-by-side comparisons, identifying leaders in various
-    categories and providing strategic insights on competitive positioning.
-    
-    Attributes:
-        client (genai.Client): Google Generative AI client instance
-        model_id (str): Gemini model identifier for comparative analysis
-        
-    Example:
-        >>> comparison_agent = ComparisonAgent()
-        >>> comparison = comparison_agent.compare_companies([data1, data2, data3])
-        >>> report = comparison_agent.generate_comparison_report(comparison)
-        >>> filename = comparison_agent.save_comparison_report(report, ["Co1", "Co2"])
-    """
-    
-    def __init__(self):
-        """
-        Initialize the ComparisonAgent with Gemini AI client.
-        
-        Sets up the Google Generative AI client for generating multi-company
-        comparative analysis and strategic insights.
-        """
-        self.client = genai.Client(api_key=GOOGLE_API_KEY)
-        self.model_id = 'gemini-2.5-flash'
-    
-    def compare_companies(self, companies_data: list) -> dict:
-        """
-        Compare multiple companies and generate comprehensive comparative analysis.
-        
-        Performs deep comparative analysis across 2-5 companies, covering:
-        - Market position comparison
-        - Product & service comparison
-        - Competitive advantages and weaknesses
-        - Pricing strategy comparison
-        - SWOT comparison matrix
-        - Head-to-head analysis
-        - Strategic positioning
-        - Winner analysis (by category)
-        - Final verdict
-        
-        Args:
-            companies_data (list): List of company data dictionaries (2-5 companies).
-                Each dict should contain:
-                    - 'company_name': str
-                    - 'company_research': dict with 'summary'
-                    - 'competitors_research': dict with 'identified_competitors'
-                    - 'competitive_analysis': dict with 'competitive_analysis'
-                    - 'swot_analysis': dict with 'swot_analysis'
-                    - 'pricing_analysis': dict with 'analysis'
-                    
-        Returns:
-            dict: Comprehensive comparison analysis with structure:
-                {
-                    'comparison_analysis': str,     # Full comparative analysis
-                    'companies_compared': list,     # List of company names
-                    'comparison_date': str          # Timestamp of analysis
-                }
-                
-        Raises:
-            Exception: If AI analysis fails or insufficient data provided
-            
-        Example:
-            >>> companies_data = [
-            ...     {'company_name': 'Slack', 'company_research': {...}, ...},
-            ...     {'company_name': 'Microsoft Teams', 'company_research': {...}, ...}
-            ... ]
-            >>> result = agent.compare_companies(companies_data)
-            >>> print(result['comparison_analysis'][:200])
-            
-            ## Comparative Analysis: Slack vs Microsoft Teams
-            
-            ### 1. Market Position Comparison
-            Slack maintains strong position in SMB segment...
-            
-        Note:
-            - Supports 2-5 companies for optimal comparison depth
-            - Analysis is data-driven using provided company research
-            - Provides objective, balanced comparisons
-        """
-        print(f'\n🔄 Comparing {len(companies_data)} companies...')
-        
-        company_names = [data['company_name'] for data in companies_data]
-        
-        # Prepare comparison data
-        comparison_prompt = f'''
+
+# Prompt scaffolding hoisted to module scope so the constant text is built
+# once, not per call; the per-company section bar is likewise shared
+_COMPARISON_HEADER_TEMPLATE = '''
 You are a business analyst comparing multiple companies. Based on the comprehensive data provided for each company, create a detailed comparative analysis.
 
-COMPANIES BEING COMPARED: {', '.join(company_names)}
+COMPANIES BEING COMPARED: {company_list}
 
 '''
-        
-        # Add each company's data
-        for i, company_data in enumerate(companies_data, 1):
-            company_name = company_data['company_name']
-            comparison_prompt += f'''
-{'=' * 80}
-COMPANY {i}: {company_name}
-{'=' * 80}
+
+_SECTION_BAR = '=' * 80
+
+_COMPANY_SECTION_TEMPLATE = '''
+{bar}
+COMPANY {index}: {company_name}
+{bar}
 
 Company Overview:
-{company_data.get('company_research', {}).get('summary', 'N/A')}
+{summary}
 
 Competitors:
-{company_data.get('competitors_research', {}).get('identified_competitors', 'N/A')}
+{competitors}
 
 Competitive Analysis:
-{company_data.get('competitive_analysis', {}).get('competitive_analysis', 'N/A')}
+{competitive_analysis}
 
 SWOT Analysis:
-{company_data.get('swot_analysis', {}).get('swot_analysis', 'N/A')}
+{swot}
 
 Pricing:
-{company_data.get('pricing_analysis', {}).get('analysis', 'N/A')}
+{pricing}
 
 '''
-        
-        comparison_prompt += f'''
+
+_COMPARISON_INSTRUCTIONS_TEMPLATE = '''
 Based on ALL the above data, create a comprehensive multi-company comparison with these sections:
 
-## Comparative Analysis: {' vs '.join(company_names)}
+## Comparative Analysis: {comparison_title}
 
 ### 1. Market Position Comparison
 Compare how each company is positioned in the market:
@@ -208,19 +130,398 @@ Overall comparison summary and insights.
 
 Be specific, data-driven, and objective. Use the actual information provided for each company.
 '''
+
+
+_EXCESS_BLANK_LINES = re.compile(r'\n{3,}')
+
+_UNSAFE_FILENAME_CHARS = re.compile(r'[^A-Za-z0-9_-]')
+
+
+def _safe_name(name: str) -> str:
+    """
+    Make a company name safe to embed in a filename.
+
+    Replaces path separators and other special characters and caps the
+    length, so names with slashes, colons or shell metacharacters can't
+    produce invalid paths or path traversal.
+
+    Args:
+        name (str): Raw company name
+
+    Returns:
+        str: Sanitized name, at most 24 characters
+    """
+    return _UNSAFE_FILENAME_CHARS.sub('_', name)[:24]
+
+
+def _cap(text, limit: int = 4000) -> str:
+    """
+    Normalize and truncate a prompt field to keep input tokens bounded.
+
+    Collapses runs of blank lines and cuts the text at the given limit.
+    Oversize research summaries balloon the comparison prompt (cost and
+    latency) without improving analysis quality.
+
+    Args:
+        text: Field text (non-strings are stringified)
+        limit (int): Maximum characters to keep (default: 4000)
+
+    Returns:
+        str: Cleaned text, truncated with a marker if it exceeded the limit
+    """
+    text = _EXCESS_BLANK_LINES.sub('\n\n', str(text)).rstrip()
+    if len(text) > limit:
+        return text[:limit] + '…[truncated]'
+    return text
+
+
+class ComparisonAgent:
+    """
+    Agent responsible for multi-company comparative analysis.
+    
+    This agent takes analysis data from multiple companies and creates
+    comprehensive side-by-side comparisons, identifying leaders in various
+    categories and providing strategic insights on competitive positioning.
+    
+    Attributes:
+        client (genai.Client): Google Generative AI client instance
+        model_id (str): Gemini model identifier for comparative analysis
+        
+    Example:
+        >>> comparison_agent = ComparisonAgent()
+        >>> comparison = comparison_agent.compare_companies([data1, data2, data3])
+        >>> report = comparison_agent.generate_comparison_report(comparison)
+        >>> filename = comparison_agent.save_comparison_report(report, ["Co1", "Co2"])
+    """
+    
+    def __init__(self):
+        """
+        Initialize the ComparisonAgent with Gemini AI client.
         
-        response = self.client.models.generate_content(
+        Uses the shared Gemini client (one HTTP connection pool across all
+        agents) for generating multi-company comparative analysis.
+        """
+        self.client = get_client()
+        self.model_id = GEMINI_MODEL_ID
+    
+    async def analyze_many(self, companies_data: list) -> list:
+        """
+        Run the analyst stage for multiple companies concurrently.
+
+        Fans out AnalystAgent.analyze_all across all companies with
+        asyncio.gather, so the per-company Gemini calls overlap instead of
+        running one company after another. A single AnalystAgent (and thus a
+        single genai.Client connection pool) is shared across all companies,
+        and concurrency is bounded with a semaphore to respect Gemini
+        per-minute rate limits.
+
+        Args:
+            companies_data (list): List of researched company dictionaries.
+                Each dict should contain:
+                    - 'company_name': str
+                    - 'company_research': dict with 'summary'
+                    - 'competitors_research': dict with 'identified_competitors'
+
+        Returns:
+            list: The input dictionaries (in order) each extended with
+                'competitive_analysis', 'swot_analysis' and 'pricing_analysis'
+                keys, ready for compare_companies().
+
+        Example:
+            >>> companies_data = [{'company_name': 'Slack', ...}, ...]
+            >>> analyzed = run_async(agent.analyze_many(companies_data))
+            >>> comparison = agent.compare_companies(analyzed)
+
+        Note:
+            - Concurrency is capped at 5 in-flight companies
+            - Wall time drops from O(N) to ~O(1) Gemini latencies
+        """
+        logger.info('⚡ Analyzing %d companies concurrently...', len(companies_data))
+
+        analyst = AnalystAgent()
+        semaphore = asyncio.Semaphore(5)
+
+        async def analyze_one(company_data: dict) -> dict:
+            async with semaphore:
+                # Price against the identified competitors rather than
+                # passing the company as its own competitor
+                results = await analyst.analyze_all(
+                    company_data.get('company_research', {}),
+                    company_data.get('competitors_research', {}),
+                    extract_competitor_names(company_data.get('competitors_research', {}))
+                )
+            return {**company_data, **results}
+
+        analyzed = await asyncio.gather(
+            *[analyze_one(company_data) for company_data in companies_data]
+        )
+
+        logger.info('✅ Per-company analysis complete')
+
+        return list(analyzed)
+
+    def analyze_many_batch(self, companies_data: list, poll_interval: float = 10.0) -> list:
+        """
+        Run the per-company analyst stage through the Gemini batch API.
+
+        The competition and pricing prompts for all companies are independent,
+        so they are submitted as a single batch job (one round-trip, batch
+        pricing) instead of 2xN individual requests. The SWOT prompts depend
+        on the competition outputs and go out as a second batch once the
+        first completes. Results are assembled into the same shape
+        analyze_many() produces.
+
+        Args:
+            companies_data (list): List of researched company dictionaries
+                (same shape as analyze_many expects)
+            poll_interval (float): Seconds between batch job status polls
+
+        Returns:
+            list: The input dictionaries (in order) each extended with
+                'competitive_analysis', 'swot_analysis' and 'pricing_analysis'
+
+        Raises:
+            RuntimeError: If a batch job ends in a non-success state
+
+        Example:
+            >>> analyzed = agent.analyze_many_batch(companies_data)
+            >>> comparison = agent.compare_companies(analyzed)
+
+        Note:
+            - Falls back to analyze_many() for a single company, where the
+              batch round-trip overhead is not worth it
+            - Batch jobs are queued server-side, so this trades latency for
+              cost and rate-limit headroom; prefer analyze_many() when
+              interactive latency matters
+        """
+        if len(companies_data) < 2:
+            return run_async(self.analyze_many(companies_data))
+
+        logger.info('📦 Submitting batch analysis for %d companies...', len(companies_data))
+
+        analyst = AnalystAgent()
+
+        # Gather pricing search data up front (concurrent blocking
+        # searches), pricing each company against its identified
+        # competitors rather than against itself
+        async def collect_pricing(company_data: dict) -> tuple:
+            company_name = company_data['company_name']
+            competitors = extract_competitor_names(
+                company_data.get('competitors_research', {})
+            )
+            company_pricing, *competitor_results = await asyncio.gather(
+                analyst._search_pricing_async(company_name),
+                *[analyst._search_pricing_async(competitor) for competitor in competitors]
+            )
+            competitor_pricing = [
+                {'competitor': competitor, 'results': results}
+                for competitor, results in zip(competitors, competitor_results)
+            ]
+            return company_pricing, competitor_pricing
+
+        async def collect_all_pricing() -> list:
+            return await asyncio.gather(
+                *[collect_pricing(d) for d in companies_data]
+            )
+
+        pricing_inputs = run_async(collect_all_pricing())
+
+        # Batch 1: competition + pricing prompts (independent across companies)
+        first_requests = []
+        for company_data, (company_pricing, competitor_pricing) in zip(companies_data, pricing_inputs):
+            first_requests.append({'contents': analyst._build_competition_prompt(
+                company_data.get('company_research', {}),
+                company_data.get('competitors_research', {})
+            )})
+            first_requests.append({'contents': analyst._build_pricing_prompt(
+                company_data['company_name'], company_pricing, competitor_pricing
+            )})
+
+        first_responses = self._run_batch(first_requests, poll_interval)
+
+        # Batch 2: SWOT prompts (depend on the competition outputs)
+        analyzed = []
+        swot_requests = []
+        for i, (company_data, (company_pricing, competitor_pricing)) in enumerate(
+                zip(companies_data, pricing_inputs)):
+            competitive_analysis = {'competitive_analysis': first_responses[2 * i]}
+            pricing_analysis = {
+                'company_pricing': company_pricing,
+                'competitor_pricing': competitor_pricing,
+                'analysis': first_responses[2 * i + 1]
+            }
+            analyzed.append({
+                **company_data,
+                'competitive_analysis': competitive_analysis,
+                'pricing_analysis': pricing_analysis
+            })
+            swot_requests.append({'contents': analyst._build_swot_prompt(
+                company_data.get('company_research', {}), competitive_analysis
+            )})
+
+        swot_responses = self._run_batch(swot_requests, poll_interval)
+
+        for company_data, swot_text in zip(analyzed, swot_responses):
+            company_data['swot_analysis'] = {'swot_analysis': swot_text}
+
+        logger.info('✅ Batch analysis complete')
+
+        return analyzed
+
+    def _run_batch(self, requests: list, poll_interval: float) -> list:
+        """
+        Submit inlined requests as one Gemini batch job and wait for results.
+
+        Args:
+            requests (list): List of {'contents': prompt} request dicts
+            poll_interval (float): Seconds between status polls
+
+        Returns:
+            list: Response texts in the same order as the requests
+
+        Raises:
+            RuntimeError: If the job ends in a non-success state
+        """
+        job = self.client.batches.create(
             model=self.model_id,
-            contents=comparison_prompt
+            src=requests,
+            config={'display_name': f'comparison_batch_{datetime.now().strftime("%Y%m%d_%H%M%S")}'}
         )
+
+        terminal_states = {
+            'JOB_STATE_SUCCEEDED', 'JOB_STATE_FAILED',
+            'JOB_STATE_CANCELLED', 'JOB_STATE_EXPIRED'
+        }
+
+        while job.state.name not in terminal_states:
+            time.sleep(poll_interval)
+            job = self.client.batches.get(name=job.name)
+
+        if job.state.name != 'JOB_STATE_SUCCEEDED':
+            raise RuntimeError(f'Gemini batch job {job.name} ended in state {job.state.name}')
+
+        return [resp.response.text for resp in job.dest.inlined_responses]
+
+    def compare_companies(self, companies_data: list, chunk_callback=None) -> dict:
+        """
+        Compare multiple companies and generate comprehensive comparative analysis.
+        
+        Performs deep comparative analysis across 2-5 companies, covering:
+        - Market position comparison
+        - Product & service comparison
+        - Competitive advantages and weaknesses
+        - Pricing strategy comparison
+        - SWOT comparison matrix
+        - Head-to-head analysis
+        - Strategic positioning
+        - Winner analysis (by category)
+        - Final verdict
+        
+        Args:
+            companies_data (list): List of company data dictionaries (2-5 companies).
+                Each dict should contain:
+                    - 'company_name': str
+                    - 'company_research': dict with 'summary'
+                    - 'competitors_research': dict with 'identified_competitors'
+                    - 'competitive_analysis': dict with 'competitive_analysis'
+                    - 'swot_analysis': dict with 'swot_analysis'
+                    - 'pricing_analysis': dict with 'analysis'
+            chunk_callback (callable, optional): Called with each streamed
+                response chunk as it arrives, letting callers overlap I/O
+                (progress display, incremental file writes) with generation
+
+        Returns:
+            dict: Comprehensive comparison analysis with structure:
+                {
+                    'comparison_analysis': str,     # Full comparative analysis
+                    'companies_compared': list,     # List of company names
+                    'comparison_date': str          # Timestamp of analysis
+                }
+                
+        Raises:
+            Exception: If AI analysis fails or insufficient data provided
+            
+        Example:
+            >>> companies_data = [
+            ...     {'company_name': 'Slack', 'company_research': {...}, ...},
+            ...     {'company_name': 'Microsoft Teams', 'company_research': {...}, ...}
+            ... ]
+            >>> result = agent.compare_companies(companies_data)
+            >>> print(result['comparison_analysis'][:200])
+            
+            ## Comparative Analysis: Slack vs Microsoft Teams
+            
+            ### 1. Market Position Comparison
+            Slack maintains strong position in SMB segment...
+            
+        Note:
+            - Supports 2-5 companies for optimal comparison depth
+            - Analysis is data-driven using provided company research
+            - Provides objective, balanced comparisons
+        """
+        logger.info('🔄 Comparing %d companies...', len(companies_data))
+        
+        company_names = [data['company_name'] for data in companies_data]
         
+        # Build the prompt as a parts list with a single join at the end,
+        # so the multi-KB per-company sections are not re-copied on each +=
+        parts = [_COMPARISON_HEADER_TEMPLATE.format(company_list=', '.join(company_names))]
+
+        # Add each company's data, binding each nested lookup once per company
+        for i, company_data in enumerate(companies_data, 1):
+            research = company_data.get('company_research') or {}
+            competitors_research = company_data.get('competitors_research') or {}
+            competitive = company_data.get('competitive_analysis') or {}
+            swot = company_data.get('swot_analysis') or {}
+            pricing = company_data.get('pricing_analysis') or {}
+
+            parts.append(_COMPANY_SECTION_TEMPLATE.format(
+                bar=_SECTION_BAR,
+                index=i,
+                company_name=company_data['company_name'],
+                summary=_cap(research.get('summary', 'N/A'), 3000),
+                competitors=_cap(competitors_research.get('identified_competitors', 'N/A'), 2000),
+                competitive_analysis=_cap(competitive.get('competitive_analysis', 'N/A')),
+                swot=_cap(swot.get('swot_analysis', 'N/A')),
+                pricing=_cap(pricing.get('analysis', 'N/A'), 2000)
+            ))
+
+        parts.append(_COMPARISON_INSTRUCTIONS_TEMPLATE.format(
+            comparison_title=' vs '.join(company_names)
+        ))
+
+        comparison_prompt = ''.join(parts)
+
+        comparison_text = get_cached_response(self.model_id, comparison_prompt)
+        if comparison_text is None:
+            # Stream the long comparison response; callers can overlap work
+            # (e.g. writing the report file) with generation via chunk_callback.
+            # Retried as a whole on transient errors, so a callback may see
+            # a partial stream followed by a fresh one.
+            def stream_once() -> str:
+                chunks = []
+                for chunk in self.client.models.generate_content_stream(
+                    model=self.model_id,
+                    contents=comparison_prompt
+                ):
+                    if chunk.text:
+                        chunks.append(chunk.text)
+                        if chunk_callback:
+                            chunk_callback(chunk.text)
+                return ''.join(chunks)
+
+            comparison_text = call_with_retry(stream_once)
+            store_response(self.model_id, comparison_prompt, comparison_text)
+        elif chunk_callback:
+            chunk_callback(comparison_text)
+
         comparison = {
-            'comparison_analysis': response.text,
+            'comparison_analysis': comparison_text,
             'companies_compared': company_names,
             'comparison_date': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         }
         
-        print(f'✅ Multi-company comparison complete')
+        logger.info('✅ Multi-company comparison complete')
         
         return comparison
     
@@ -256,10 +557,16 @@ Be specific, data-driven, and objective. Use the actual information provided for
             - Ready for markdown or PDF export
         """
         company_names = comparison_data['companies_compared']
-        
+
+        # Reuse the timestamp recorded by compare_companies so the header
+        # and metadata block agree (and skip a second wall-clock read)
+        analysis_dt = datetime.strptime(
+            comparison_data['comparison_date'], '%Y-%m-%d %H:%M:%S'
+        )
+
         report = f'''# Multi-Company Competitive Comparison
 *Comparing: {', '.join(company_names)}*
-*Generated on {datetime.now().strftime('%B %d, %Y at %H:%M')}*
+*Generated on {analysis_dt.strftime('%B %d, %Y at %H:%M')}*
 
 ---
 
@@ -307,12 +614,40 @@ Be specific, data-driven, and objective. Use the actual information provided for
             - Spaces in company names replaced with underscores
             - Timestamp format: YYYYMMDD_HHMMSS
         """
-        companies_str = '_vs_'.join([name.replace(' ', '_') for name in company_names])
+        companies_str = '_vs_'.join([_safe_name(name) for name in company_names])
+
+        # Keep the path inside common filesystem limits; fall back to a
+        # short digest of the full name list when the join gets too long
+        if len(companies_str) > 120:
+            digest = hashlib.blake2b(
+                '_'.join(company_names).encode('utf-8'), digest_size=6
+            ).hexdigest()
+            companies_str = f'{_safe_name(company_names[0])}_and_{len(company_names) - 1}_more_{digest}'
+
         filename = f'comparison_{companies_str}_{datetime.now().strftime("%Y%m%d_%H%M%S")}.md'
-        
-        with open(filename, 'w', encoding='utf-8') as f:
-            f.write(report)
-        
-        print(f'\n📄 Comparison report saved to: {filename}')
-        
-        return filename
\ No newline at end of file
+
+        Path(filename).write_text(report, encoding='utf-8')
+
+        logger.info('📄 Comparison report saved to: %s', filename)
+
+        return filename
+
+    async def save_comparison_report_async(self, report: str, company_names: list) -> str:
+        """
+        Async variant of save_comparison_report for async pipelines.
+
+        Offloads the blocking disk write to a worker thread so the event
+        loop can keep servicing concurrent Gemini work while the report
+        is written.
+
+        Args:
+            report (str): Complete markdown-formatted report content
+            company_names (list): List of company names being compared
+
+        Returns:
+            str: Filename of the saved comparison report
+
+        Example:
+            >>> filename = await agent.save_comparison_report_async(report, ["Slack", "Teams"])
+        """
+        return await asyncio.to_thread(self.save_comparison_report, report, company_names)
\ No newline at end of file
@@ -14,10 +14,132 @@ Date: November 2025
 """
 
 import os
-from api_config import GOOGLE_API_KEY
-from google import genai
-from google.genai import types
+import asyncio
+import json
+import time
 from datetime import datetime
+from google.genai import types
+from utils.gemini_client import get_client
+from utils.llm_cache import get_or_call
+from utils.rate_limit import get_limiter
+
+# Static prompt scaffolding, hoisted so each call only formats the variable
+# fields. The generation date is added to the report header locally rather
+# than sent to the model, keeping the prompt — and its cache key — invariant
+# across days. The instruction block is fully static so it can be uploaded
+# once to Gemini's context cache and referenced by name on later calls.
+_REPORT_INSTRUCTIONS = '''
+You are a business intelligence analyst. Generate a comprehensive competitive analysis report.
+
+Use ALL the analysis data that follows to create a professional report with
+these sections (the title and generation date are added separately, so start
+directly with the Executive Summary):
+
+## Executive Summary
+[2-3 paragraph overview of key findings]
+
+---
+
+## 1. Company Overview
+[Details about the company]
+
+---
+
+## 2. Competitive Landscape
+[Overview of main competitors and market dynamics]
+
+---
+
+## 3. Competitive Analysis
+[Detailed comparison with competitors]
+
+---
+
+## 4. SWOT Analysis
+[Present the SWOT in clear format]
+
+---
+
+## 5. Pricing Strategy Analysis
+[Pricing positioning and recommendations]
+
+---
+
+## 6. Strategic Recommendations
+[3-5 actionable strategic recommendations based on the analysis]
+
+---
+
+## Conclusion
+[Final thoughts and key takeaways]
+
+Make it professional, data-driven, and actionable. Use markdown formatting.
+'''
+
+_REPORT_DATA_TEMPLATE = '''
+COMPANY: {company_name}
+
+COMPANY RESEARCH:
+{company_research}
+
+IDENTIFIED COMPETITORS:
+{identified_competitors}
+
+COMPETITIVE ANALYSIS:
+{competitive_analysis}
+
+SWOT ANALYSIS:
+{swot_analysis}
+
+PRICING ANALYSIS:
+{pricing_analysis}
+'''
+
+# Server-side context cache lifetime for the static instruction block
+_TEMPLATE_CACHE_TTL = 3600
+
+# Single-pass translation table mapping filesystem-unsafe characters
+# (spaces, separators, reserved punctuation) to underscores
+_SAFE_FILENAME = str.maketrans({c: '_' for c in ' /\\:*?"<>|&'})
+
+
+def _report_cache_key(company_name: str, all_data: dict) -> str:
+    """
+    Build the cache key text for a report without assembling the prompt.
+
+    Keying on the company name plus a canonical dump of the analysis data
+    lets cache hits return before the multi-kilobyte prompt is formatted.
+
+    Args:
+        company_name (str): Name of the company being analyzed
+        all_data (dict): Complete analysis data
+
+    Returns:
+        str: Cache key text for the response cache
+    """
+    return company_name + json.dumps(all_data, sort_keys=True, default=str)
+
+_REPORT_HEADER_TEMPLATE = '''# Competitive Analysis Report: {company_name}
+*Generated on {report_date}*
+
+---
+
+'''
+
+
+class _CacheMiss(Exception):
+    """Raised by _signal_cache_miss when get_or_call finds no cached body."""
+
+
+def _signal_cache_miss() -> str:
+    """
+    call_fn handed to get_or_call when the caller only wants a probe.
+
+    Streaming callers cannot let get_or_call run the model for them (the
+    chunks must be yielded as they arrive), so this raises instead of
+    generating; the caller catches _CacheMiss and streams itself.
+    """
+    raise _CacheMiss
 
 
 class ReportGeneratorAgent:
@@ -42,11 +164,15 @@ class ReportGeneratorAgent:
         """
         Initialize the ReportGeneratorAgent with Gemini AI client.
         
-        Sets up the Google Generative AI client for generating professional
-        business intelligence reports.
+        Uses the shared Google Generative AI client so report generation
+        traffic reuses the same connection pool as the other agents.
         """
-        self.client = genai.Client(api_key=GOOGLE_API_KEY)
+        self.client = get_client()
         self.model_id = 'gemini-2.5-flash'
+        # Server-side context cache for the static instruction block,
+        # created lazily and refreshed when its TTL lapses
+        self._template_cache_name = None
+        self._template_cache_expiry = 0.0
     
     def generate_final_report(self, company_name: str, all_data: dict) -> str:
         """
@@ -97,86 +223,276 @@ class ReportGeneratorAgent:
             - Professional tone suitable for business stakeholders
         """
         print(f'\n📝 Generating final report for {company_name}...')
-        
-        prompt = f'''
-You are a business intelligence analyst. Generate a comprehensive competitive analysis report.
 
-Use ALL the following data to create a professional report:
+        cache_key = _report_cache_key(company_name, all_data)
 
-COMPANY RESEARCH:
-{all_data.get('company_research', {}).get('summary', 'N/A')}
+        def generate_report() -> str:
+            # Prompt assembly only happens on a cache miss
+            data_section = self._build_report_data(company_name, all_data)
+            prompt = _REPORT_INSTRUCTIONS + data_section
+            contents, config = self._report_call_args(prompt, data_section)
+            limiter = get_limiter()
+            limiter.acquire(limiter.estimate_tokens(contents))
+            parts = []
+            stream = self.client.models.generate_content_stream(
+                model=self.model_id,
+                contents=contents,
+                config=config
+            )
+            for chunk in stream:
+                if chunk.text:
+                    parts.append(chunk.text)
+            return ''.join(parts)
 
-IDENTIFIED COMPETITORS:
-{all_data.get('competitors_research', {}).get('identified_competitors', 'N/A')}
+        body = get_or_call(cache_key, generate_report, namespace='generate_final_report')
+        report = self._report_header(company_name) + body
 
-COMPETITIVE ANALYSIS:
-{all_data.get('competitive_analysis', {}).get('competitive_analysis', 'N/A')}
+        print(f'✅ Final report generated!')
 
-SWOT ANALYSIS:
-{all_data.get('swot_analysis', {}).get('swot_analysis', 'N/A')}
+        return report
 
-PRICING ANALYSIS:
-{all_data.get('pricing_analysis', {}).get('analysis', 'N/A')}
+    def stream_final_report(self, company_name: str, all_data: dict):
+        """
+        Yield the final report incrementally as the model generates it.
 
-Create a professional report with these sections:
+        Streaming counterpart of generate_final_report for UIs that can
+        render partial output (e.g. st.write_stream): the local header is
+        yielded immediately and body chunks follow as they arrive from
+        Gemini, so the first words appear at time-to-first-token instead
+        of after the full generation finishes. Shares the response cache
+        with generate_final_report — a hit yields the stored body in one
+        piece, and a freshly streamed body is stored back for later calls.
 
-# Competitive Analysis Report: {company_name}
-*Generated on {datetime.now().strftime('%B %d, %Y')}*
+        Args:
+            company_name (str): Name of the company being analyzed
+            all_data (dict): Complete analysis data (see generate_final_report)
 
----
+        Yields:
+            str: Report text chunks, header first
 
-## Executive Summary
-[2-3 paragraph overview of key findings]
+        Example:
+            >>> report = st.write_stream(
+            ...     generator.stream_final_report('Notion', all_data))
+        """
+        print(f'\n📝 Generating final report for {company_name}...')
 
----
+        yield self._report_header(company_name)
 
-## 1. Company Overview
-[Details about {company_name}]
+        cache_key = _report_cache_key(company_name, all_data)
 
----
+        # Probe the cache through get_or_call so the hit logic (exact
+        # and semantic) stays in one place; the sentinel raise signals a
+        # miss back to this streaming path without storing anything
+        try:
+            body = get_or_call(cache_key, _signal_cache_miss,
+                               namespace='generate_final_report')
+        except _CacheMiss:
+            body = None
 
-## 2. Competitive Landscape
-[Overview of main competitors and market dynamics]
+        if body is not None:
+            yield body
+            print(f'✅ Final report generated!')
+            return
 
----
+        data_section = self._build_report_data(company_name, all_data)
+        prompt = _REPORT_INSTRUCTIONS + data_section
+        contents, config = self._report_call_args(prompt, data_section)
+        limiter = get_limiter()
+        limiter.acquire(limiter.estimate_tokens(contents))
+        parts = []
+        stream = self.client.models.generate_content_stream(
+            model=self.model_id,
+            contents=contents,
+            config=config
+        )
+        for chunk in stream:
+            if chunk.text:
+                parts.append(chunk.text)
+                yield chunk.text
 
-## 3. Competitive Analysis
-[Detailed comparison with competitors]
+        # Store the streamed body so later calls for the same inputs hit
+        body = ''.join(parts)
+        get_or_call(cache_key, lambda: body, namespace='generate_final_report')
 
----
+        print(f'✅ Final report generated!')
 
-## 4. SWOT Analysis
-[Present the SWOT in clear format]
+    def generate_and_save_report(self, company_name: str, all_data: dict) -> tuple:
+        """
+        Generate the final report and stream it straight to disk.
 
----
+        Merges generate_final_report and save_report into one streaming
+        pipeline: response chunks are written to the report file as they
+        arrive, so file I/O overlaps generation instead of waiting for the
+        full report to buffer in memory first.
 
-## 5. Pricing Strategy Analysis
-[Pricing positioning and recommendations]
+        Args:
+            company_name (str): Name of the company being analyzed
+            all_data (dict): Complete analysis data (see generate_final_report)
 
----
+        Returns:
+            tuple: (report text, saved filename)
 
-## 6. Strategic Recommendations
-[3-5 actionable strategic recommendations based on the analysis]
+        Example:
+            >>> report, filename = generator.generate_and_save_report("Notion", all_data)
+            >>> print(filename)
+            Notion_competitive_analysis_20251130_190229.md
 
----
+        Note:
+            Cached responses (GEMINI_CACHE=1) skip streaming and are written
+            to the file in one shot.
+        """
+        print(f'\n📝 Generating final report for {company_name}...')
 
-## Conclusion
-[Final thoughts and key takeaways]
+        cache_key = _report_cache_key(company_name, all_data)
+        filename = self._report_filename(company_name)
+        header = self._report_header(company_name)
+
+        def generate_report() -> str:
+            # Prompt assembly only happens on a cache miss
+            data_section = self._build_report_data(company_name, all_data)
+            prompt = _REPORT_INSTRUCTIONS + data_section
+            contents, config = self._report_call_args(prompt, data_section)
+            limiter = get_limiter()
+            limiter.acquire(limiter.estimate_tokens(contents))
+            parts = []
+            stream = self.client.models.generate_content_stream(
+                model=self.model_id,
+                contents=contents,
+                config=config
+            )
+            with open(filename, 'w', encoding='utf-8') as f:
+                f.write(header)
+                for chunk in stream:
+                    if chunk.text:
+                        f.write(chunk.text)
+                        f.flush()
+                        parts.append(chunk.text)
+            return ''.join(parts)
+
+        body = get_or_call(cache_key, generate_report, namespace='generate_final_report')
+        report = header + body
+
+        # A cache hit bypasses the streaming writer, so make sure the
+        # report file exists either way
+        if not os.path.exists(filename):
+            with open(filename, 'w', encoding='utf-8') as f:
+                f.write(report)
 
-Make it professional, data-driven, and actionable. Use markdown formatting.
-'''
-        
-        response = self.client.models.generate_content(
-            model=self.model_id,
-            contents=prompt
-        )
-        
-        report = response.text
-        
         print(f'✅ Final report generated!')
-        
-        return report
-    
+        print(f'\n📄 Report saved to: {filename}')
+
+        return report, filename
+
+    def _build_report_data(self, company_name: str, all_data: dict) -> str:
+        """
+        Build the variable (per-company) data section of the report prompt.
+
+        Args:
+            company_name (str): Name of the company being analyzed
+            all_data (dict): Complete analysis data (see generate_final_report)
+
+        Returns:
+            str: Formatted analysis data block appended after the static
+                instruction scaffolding
+        """
+        return _REPORT_DATA_TEMPLATE.format_map({
+            'company_name': company_name,
+            'company_research': all_data.get('company_research', {}).get('summary', 'N/A'),
+            'identified_competitors': all_data.get('competitors_research', {}).get('identified_competitors', 'N/A'),
+            'competitive_analysis': all_data.get('competitive_analysis', {}).get('competitive_analysis', 'N/A'),
+            'swot_analysis': all_data.get('swot_analysis', {}).get('swot_analysis', 'N/A'),
+            'pricing_analysis': all_data.get('pricing_analysis', {}).get('analysis', 'N/A')
+        })
+
+    def _report_call_args(self, prompt: str, data_section: str) -> tuple:
+        """
+        Choose contents and config for a report generation call.
+
+        When the static instruction block is live in Gemini's context
+        cache, only the per-company data section is sent and the cached
+        prefix is referenced by name, cutting prompt tokens and TTFT on
+        every report after the first. Otherwise the full prompt is sent.
+
+        Args:
+            prompt (str): Full prompt (instructions + data section)
+            data_section (str): Variable data block only
+
+        Returns:
+            tuple: (contents, config) for generate_content_stream; config
+                is None when no context cache is available
+        """
+        cache_name = self._template_cache()
+        if cache_name:
+            return data_section, types.GenerateContentConfig(cached_content=cache_name)
+        return prompt, None
+
+    def _template_cache(self):
+        """
+        Return the context-cache name for the instruction block, if usable.
+
+        Creates the server-side cache lazily and recreates it shortly
+        before the TTL lapses. Best effort: any failure (e.g. the block
+        is below the model's minimum cacheable token count) returns None
+        and callers fall back to sending the full prompt.
+
+        Returns:
+            str or None: CachedContent resource name, or None
+        """
+        now = time.monotonic()
+        if self._template_cache_name and now < self._template_cache_expiry:
+            return self._template_cache_name
+
+        try:
+            cache = self.client.caches.create(
+                model=self.model_id,
+                config=types.CreateCachedContentConfig(
+                    contents=[_REPORT_INSTRUCTIONS],
+                    ttl=f'{_TEMPLATE_CACHE_TTL}s'
+                )
+            )
+            self._template_cache_name = cache.name
+            # Refresh a minute early so in-flight calls never hit a
+            # just-expired cache entry
+            self._template_cache_expiry = now + _TEMPLATE_CACHE_TTL - 60
+            return self._template_cache_name
+        except Exception:
+            self._template_cache_name = None
+            return None
+
+    def _report_header(self, company_name: str) -> str:
+        """
+        Build the local report header (title plus generation date).
+
+        Args:
+            company_name (str): Name of the company being analyzed
+
+        Returns:
+            str: Markdown header prepended to the model-generated body
+        """
+        return _REPORT_HEADER_TEMPLATE.format_map({
+            'company_name': company_name,
+            'report_date': datetime.now().strftime('%B %d, %Y')
+        })
+
+    def _report_filename(self, company_name: str) -> str:
+        """
+        Build the timestamped report filename for a company.
+
+        Args:
+            company_name (str): Name of the company (used in filename)
+
+        Returns:
+            str: Filename in {company}_competitive_analysis_{timestamp}.md format
+
+        Note:
+            Unsafe characters in the company name (e.g. '/', ':', '&')
+            are replaced with underscores in one translate pass so names
+            like "AT&T" or "Guns N' Roses / Live" can't break the write.
+        """
+        safe_name = company_name.translate(_SAFE_FILENAME)
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        return f'{safe_name}_competitive_analysis_{timestamp}.md'
+
     def save_report(self, report: str, company_name: str) -> str:
         """
         Save report to markdown file with timestamp.
@@ -204,11 +520,31 @@ Make it professional, data-driven, and actionable. Use markdown formatting.
             - Spaces in company names are replaced with underscores
             - Timestamp format: YYYYMMDD_HHMMSS
         """
-        filename = f'{company_name.replace(" ", "_")}_competitive_analysis_{datetime.now().strftime("%Y%m%d_%H%M%S")}.md'
-        
+        filename = self._report_filename(company_name)
+
         with open(filename, 'w', encoding='utf-8') as f:
             f.write(report)
         
         print(f'\n📄 Report saved to: {filename}')
-        
-        return filename
\ No newline at end of file
+
+        return filename
+
+    async def asave_report(self, report: str, company_name: str) -> str:
+        """
+        Async counterpart of save_report for event-loop callers.
+
+        Runs the blocking file write in a worker thread so saving one
+        company's report doesn't stall concurrent Gemini calls for other
+        companies in a batch run.
+
+        Args:
+            report (str): Complete markdown-formatted report content
+            company_name (str): Name of the company (used in filename)
+
+        Returns:
+            str: Filename of the saved report
+
+        Example:
+            >>> filename = await generator.asave_report(report_text, "Notion")
+        """
+        return await asyncio.to_thread(self.save_report, report, company_name)
\ No newline at end of file
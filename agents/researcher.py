@@ -15,15 +15,95 @@ Date: November 2025
 """
 
 import os
-from api_config import GOOGLE_API_KEY
-from google import genai
-from google.genai import types
-from dotenv import load_dotenv
+import asyncio
+import concurrent.futures
 import sys
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.gemini_client import get_client, run_async
 from utils.tools import search_company_info, search_competitors, fetch_webpage_content
+from utils.llm_cache import get_or_call_async
+from utils.rate_limit import get_limiter
 
-load_dotenv()
+# Static prompt scaffolding, hoisted so each call only formats the variable
+# fields and cache keys stay stable across runs. Instructions lead and the
+# per-company data trails, giving every call an identical prefix for
+# provider-side prompt caching to match on.
+_COMPANY_SUMMARY_PROMPT = """
+Extract key information about the company from the search results and web
+content below. Provide a structured summary with:
+1. Company Overview (what they do, their mission)
+2. Main Products/Services
+3. Target Market
+4. Key Features/Differentiators
+
+Keep it concise and factual.
+
+COMPANY: {company_name}
+
+Search Results:
+{search_results}
+
+Web Content:
+{web_content}
+"""
+
+_COMPETITOR_ID_PROMPT = """
+Identify the top 3-5 main competitors of the company from the search
+results below. For each competitor, provide:
+- Company name
+- Brief description
+- Why they're a competitor
+
+Format as a clear list.
+
+COMPANY: {company_name}
+
+Search Results:
+{search_results}
+"""
+
+# Per-source token budget for web content included in prompts. Tokens are
+# estimated at ~4 characters each (same heuristic as the rate limiter), so
+# the per-source prompt cost is capped deterministically regardless of how
+# long the fetched page is. Set to 0 or less to disable truncation.
+CONTENT_TOKEN_BUDGET = 300
+_CHARS_PER_TOKEN = 4
+
+
+# Process-local fetch cache, successful fetches only (matches the
+# skip-empty behavior of the pricing search cache in utils.tools)
+_fetch_cache = {}
+_FETCH_CACHE_MAX = 256
+
+
+def _cached_fetch(url: str) -> str:
+    """
+    Fetch webpage content with a process-local cache keyed on URL.
+
+    Overlapping markets resurface the same pages (a competitor's homepage
+    shows up when researching several rivals), so repeat fetches within a
+    session come straight from memory instead of re-downloading. Failed
+    fetches return '' and are deliberately not cached — under lru_cache a
+    single transient network error pinned an empty page for the process
+    lifetime, which for the Streamlit server is indefinitely.
+
+    Args:
+        url (str): URL to fetch
+
+    Returns:
+        str: Extracted page text (see utils.tools.fetch_webpage_content)
+    """
+    cached = _fetch_cache.get(url)
+    if cached is not None:
+        return cached
+
+    content = fetch_webpage_content(url)
+    if content:
+        # Cap the cache by dropping the oldest insertion
+        if len(_fetch_cache) >= _FETCH_CACHE_MAX:
+            _fetch_cache.pop(next(iter(_fetch_cache)))
+        _fetch_cache[url] = content
+    return content
 
 
 class ResearcherAgent:
@@ -49,16 +129,16 @@ class ResearcherAgent:
         """
         Initialize the ResearcherAgent with Gemini AI client.
         
-        Sets up the Google Generative AI client using the API key from
-        environment variables and configures the Gemini model.
-        
+        Uses the shared Google Generative AI client so research calls
+        multiplex over the same connection pool as the other agents.
+
         Raises:
             Exception: If GOOGLE_API_KEY is not found in environment
         """
-        self.client = genai.Client(api_key=GOOGLE_API_KEY)
+        self.client = get_client()
         self.model_id = "gemini-2.5-flash"
         
-    def research_company(self, company_name: str) -> dict:
+    async def aresearch_company(self, company_name: str) -> dict:
         """
         Conduct comprehensive research on a target company.
         
@@ -102,58 +182,71 @@ class ResearcherAgent:
             - Uses Gemini 2.5 Flash for fast analysis
         """
         print(f"\n🔍 Researching {company_name}...")
-        
+
         # Search for company information
-        search_results = search_company_info(company_name, num_results=3)
-        
+        search_results = await asyncio.to_thread(
+            search_company_info, company_name, 3
+        )
+
         # Compile research data
         research_data = {
             "company_name": company_name,
             "search_results": search_results,
             "web_content": []
         }
-        
-        # Fetch content from top results
-        for result in search_results[:2]:
-            url = result.get("link", "")
-            if url:
-                content = fetch_webpage_content(url)
-                if content:
-                    research_data["web_content"].append({
-                        "url": url,
-                        "content": content
-                    })
-        
-        # Use Gemini to extract key information
-        prompt = f"""
-Based on the following search results and web content about {company_name}, extract key information:
 
-Search Results:
-{self._format_search_results(search_results)}
+        # Fetch content from top results in parallel worker threads
+        research_data["web_content"] = await asyncio.to_thread(
+            self._fetch_web_content, search_results[:2]
+        )
 
-Web Content:
-{self._format_web_content(research_data["web_content"])}
+        # Cache key from the company name and result URLs: hits return
+        # before the prompt is ever assembled
+        cache_key = company_name + "|" + "|".join(
+            result.get("link", "") for result in search_results
+        )
 
-Provide a structured summary with:
-1. Company Overview (what they do, their mission)
-2. Main Products/Services
-3. Target Market
-4. Key Features/Differentiators
+        async def generate_summary() -> str:
+            # Use Gemini to extract key information (prompt assembly only
+            # happens on a cache miss). Formatting multi-KB fragments is
+            # pure CPU work, so run it off the event loop to keep
+            # concurrent fetches and streams draining.
+            def build_prompt() -> str:
+                return _COMPANY_SUMMARY_PROMPT.format_map({
+                    "company_name": company_name,
+                    "search_results": self._format_search_results(search_results),
+                    "web_content": self._format_web_content(research_data["web_content"])
+                })
 
-Keep it concise and factual.
-"""
-        
-        response = self.client.models.generate_content(
-            model=self.model_id,
-            contents=prompt
+            prompt = await asyncio.to_thread(build_prompt)
+            limiter = get_limiter()
+            await asyncio.to_thread(limiter.acquire, limiter.estimate_tokens(prompt))
+            response = await self.client.aio.models.generate_content(
+                model=self.model_id,
+                contents=prompt
+            )
+            return response.text
+
+        research_data["summary"] = await get_or_call_async(
+            cache_key, generate_summary, namespace="research_company"
         )
-        
-        research_data["summary"] = response.text
         print(f"✅ Research complete for {company_name}")
-        
+
         return research_data
-    
-    def research_competitors(self, company_name: str) -> dict:
+
+    def research_company(self, company_name: str) -> dict:
+        """
+        Sync wrapper around aresearch_company for existing callers.
+
+        Args:
+            company_name (str): Name of the company to research
+
+        Returns:
+            dict: Comprehensive research data (see aresearch_company)
+        """
+        return run_async(self.aresearch_company(company_name))
+
+    async def aresearch_competitors(self, company_name: str) -> dict:
         """
         Identify and research the main competitors of a target company.
         
@@ -197,38 +290,107 @@ Keep it concise and factual.
             - Provides context for competitive relationships
         """
         print(f"\n🔍 Finding competitors of {company_name}...")
-        
+
         # Search for competitors
-        competitor_results = search_competitors(company_name, num_results=5)
+        competitor_results = await asyncio.to_thread(
+            search_competitors, company_name, 5
+        )
         
-        # Use Gemini to identify top competitors
-        prompt = f"""
-Based on these search results about {company_name}'s competitors:
+        cache_key = company_name + "|" + "|".join(
+            result.get("link", "") for result in competitor_results
+        )
 
-{self._format_search_results(competitor_results)}
+        async def identify_competitors() -> str:
+            # Use Gemini to identify top competitors (prompt assembly only
+            # happens on a cache miss); formatting runs off the event loop
+            def build_prompt() -> str:
+                return _COMPETITOR_ID_PROMPT.format_map({
+                    "company_name": company_name,
+                    "search_results": self._format_search_results(competitor_results)
+                })
 
-Identify the top 3-5 main competitors. For each competitor, provide:
-- Company name
-- Brief description
-- Why they're a competitor
+            prompt = await asyncio.to_thread(build_prompt)
+            limiter = get_limiter()
+            await asyncio.to_thread(limiter.acquire, limiter.estimate_tokens(prompt))
+            response = await self.client.aio.models.generate_content(
+                model=self.model_id,
+                contents=prompt
+            )
+            return response.text
 
-Format as a clear list.
-"""
-        
-        response = self.client.models.generate_content(
-            model=self.model_id,
-            contents=prompt
-        )
-        
         competitors_data = {
             "search_results": competitor_results,
-            "identified_competitors": response.text
+            "identified_competitors": await get_or_call_async(
+                cache_key, identify_competitors, namespace="research_competitors"
+            )
         }
-        
+
         print(f"✅ Found competitors for {company_name}")
-        
+
         return competitors_data
-    
+
+    def research_competitors(self, company_name: str) -> dict:
+        """
+        Sync wrapper around aresearch_competitors for existing callers.
+
+        Args:
+            company_name (str): Name of the company whose competitors to find
+
+        Returns:
+            dict: Competitor research data (see aresearch_competitors)
+        """
+        return run_async(self.aresearch_competitors(company_name))
+
+    async def aresearch_all(self, company_name: str) -> tuple:
+        """
+        Run company and competitor research concurrently.
+
+        The two research flows are independent, so running them under
+        asyncio.gather halves the wall-clock latency of the research stage.
+
+        Args:
+            company_name (str): Name of the company to research
+
+        Returns:
+            tuple: (company research dict, competitor research dict)
+
+        Example:
+            >>> company_data, competitors_data = await researcher.aresearch_all("Slack")
+        """
+        return await asyncio.gather(
+            self.aresearch_company(company_name),
+            self.aresearch_competitors(company_name)
+        )
+
+    def _fetch_web_content(self, search_results: list) -> list:
+        """
+        Fetch webpage content for search results using a thread pool.
+
+        All fetches are submitted first and results collected afterwards,
+        so the blocking HTTP calls overlap and the stage takes roughly one
+        round-trip instead of their sum.
+
+        Args:
+            search_results (list): Search result dicts with 'link' keys
+
+        Returns:
+            list: Dicts with 'url' and 'content' for each fetch that
+                returned non-empty content, in input URL order
+        """
+        urls = [result.get("link", "") for result in search_results if result.get("link")]
+        if not urls:
+            return []
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(urls)) as executor:
+            # Submit everything before collecting any result, otherwise
+            # the fetches serialize again
+            futures = {url: executor.submit(_cached_fetch, url) for url in urls}
+            return [
+                {"url": url, "content": future.result()}
+                for url, future in futures.items()
+                if future.result()
+            ]
+
     def _format_search_results(self, results: list) -> str:
         """
         Format search results into a readable string for AI prompts.
@@ -259,19 +421,23 @@ Format as a clear list.
                Founded in...
                URL: https://...
         """
-        formatted = ""
+        # append + join is O(N) where repeated += can degrade to O(N^2)
+        parts = []
         for i, result in enumerate(results, 1):
-            formatted += f"\n{i}. {result.get('title', 'N/A')}\n"
-            formatted += f"   {result.get('snippet', 'N/A')}\n"
-            formatted += f"   URL: {result.get('link', 'N/A')}\n"
-        return formatted
+            parts.append(
+                f"\n{i}. {result.get('title', 'N/A')}\n"
+                f"   {result.get('snippet', 'N/A')}\n"
+                f"   URL: {result.get('link', 'N/A')}\n"
+            )
+        return "".join(parts)
     
     def _format_web_content(self, content_list: list) -> str:
         """
         Format webpage content into a readable string for AI prompts.
         
         Converts a list of webpage content dictionaries into a formatted text
-        string, truncating long content to 1000 characters per source.
+        string, truncating long content to an estimated token budget per
+        source (see CONTENT_TOKEN_BUDGET).
         
         Args:
             content_list (list): List of content dictionaries.
@@ -295,11 +461,35 @@ Format as a clear list.
             More content...(truncated to 1000 chars)
             
         Note:
-            Content is automatically truncated to 1000 characters to prevent
-            token limit issues in AI prompts.
+            Content is truncated by estimated token count (~4 characters
+            per token) rather than raw characters, so per-source prompt
+            cost stays deterministic across languages.
         """
-        formatted = ""
+        parts = []
         for i, item in enumerate(content_list, 1):
-            formatted += f"\nSource {i} ({item.get('url', 'N/A')}):\n"
-            formatted += f"{item.get('content', 'N/A')[:1000]}...\n"
-        return formatted
\ No newline at end of file
+            content = self._truncate_to_tokens(item.get('content', 'N/A'))
+            parts.append(f"\nSource {i} ({item.get('url', 'N/A')}):\n{content}...\n")
+        return "".join(parts)
+
+    def _truncate_to_tokens(self, content: str, budget: int = None) -> str:
+        """
+        Truncate content to an estimated token budget.
+
+        Character-count truncation maps to a wildly variable token count;
+        capping by estimated tokens keeps the billed per-source prompt
+        cost deterministic.
+
+        Args:
+            content (str): Raw webpage content
+            budget (int, optional): Token budget; defaults to
+                CONTENT_TOKEN_BUDGET. Non-positive budgets disable
+                truncation.
+
+        Returns:
+            str: Content truncated to roughly the token budget
+        """
+        if budget is None:
+            budget = CONTENT_TOKEN_BUDGET
+        if budget <= 0:
+            return content
+        return content[:budget * _CHARS_PER_TOKEN]
\ No newline at end of file
@@ -20,16 +20,21 @@ Date: November 2025
 import streamlit as st
 import sys
 import os
+import asyncio
+import concurrent.futures
+import queue
 from datetime import datetime
 from PIL import Image
 from reportlab.lib.pagesizes import letter
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Image as RLImage
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, HRFlowable, Image as RLImage
 from reportlab.lib.enums import TA_CENTER
 import re
 import html
+import tempfile
 from io import BytesIO
+from types import SimpleNamespace
 
 
 
@@ -37,10 +42,11 @@ from io import BytesIO
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from agents.researcher import ResearcherAgent
-from agents.analyst import AnalystAgent
+from agents.analyst import AnalystAgent, extract_competitor_names
 from agents.report_generator import ReportGeneratorAgent
 from agents.comparison_agent import ComparisonAgent
 from agents.visual_generator import VisualGeneratorAgent
+from utils.gemini_client import run_async, submit_async
 
 # Page config
 st.set_page_config(
@@ -50,8 +56,10 @@ st.set_page_config(
     initial_sidebar_state='expanded'
 )
 
-# Custom CSS
-st.markdown('''
+# Custom CSS, built once at import. It must still be emitted on every
+# rerun — Streamlit drops elements that are not re-emitted, so a
+# first-run-only guard would strip the styling on the next interaction.
+_CSS = '''
 <style>
     .main-header {
         font-size: 2.5rem;
@@ -67,7 +75,59 @@ st.markdown('''
         margin: 0.5rem 0;
     }
 </style>
-''', unsafe_allow_html=True)
+'''
+
+st.markdown(_CSS, unsafe_allow_html=True)
+
+
+# Compiled once at import: clean_text runs on every line of the report,
+# so per-call pattern compilation added up to hundreds of compiles per
+# PDF build. Bold and italic are fused into one alternation so each line
+# gets a single substitution pass.
+_TAG_RE = re.compile(r'<(?!/?[bi]>)[^>]+>')
+_EMPH_RE = re.compile(r'\*\*(.+?)\*\*|\*(.+?)\*')
+
+# Spacer heights for the chart and error sections; body spacing comes
+# from paragraph-style spaceBefore/spaceAfter
+_SPACE_MD = 0.3 * inch
+_SPACE_LG = 0.5 * inch
+
+
+def _emph_sub(match):
+    """Replace one matched **bold** or *italic* span with its PDF tag."""
+    if match.group(1) is not None:
+        return f'<b>{match.group(1)}</b>'
+    return f'<i>{match.group(2)}</i>'
+
+
+def _clean_text(text):
+    """Clean and sanitize text for PDF rendering"""
+    return _EMPH_RE.sub(_emph_sub, html.escape(_TAG_RE.sub('', text), quote=False))
+
+
+@st.cache_data(show_spinner=False)
+def _resized_chart_png(chart_path, mtime):
+    """
+    Downsample a chart PNG to embedding size, cached per file version.
+
+    ReportLab draws the charts at 6"x4", but the matplotlib PNGs are
+    rendered at well over that resolution; embedding the originals
+    wastes decode time and inflates the PDF several-fold. The thumbnail
+    keeps enough pixels for the print box, and keying the cache on the
+    file mtime makes PDF rebuilds for unchanged charts instant.
+
+    Args:
+        chart_path (str): Path to the chart PNG
+        mtime (float): File modification time (cache-busting key)
+
+    Returns:
+        bytes: Resized PNG contents
+    """
+    with Image.open(chart_path) as im:
+        im.thumbnail((800, 600), Image.LANCZOS)
+        buf = BytesIO()
+        im.save(buf, 'PNG', optimize=True, compress_level=9)
+    return buf.getvalue()
 
 
 def markdown_to_pdf(markdown_text, company_name, chart_paths=None):
@@ -86,25 +146,29 @@ def markdown_to_pdf(markdown_text, company_name, chart_paths=None):
             Defaults to None.
     
     Returns:
-        BytesIO: PDF file buffer ready for download or streaming
-        
+        file object: Rewound PDF buffer ready for reading; spooled to a
+            temp file past 8 MB so chart-heavy PDFs don't sit in RAM
+
     Raises:
         Exception: If PDF generation fails (returns minimal error PDF)
-        
+
     Example:
         >>> pdf_buffer = markdown_to_pdf(report_text, "Netflix", chart_paths)
-        >>> st.download_button("Download PDF", pdf_buffer, "report.pdf")
-    
+        >>> st.download_button("Download PDF", pdf_buffer.read(), "report.pdf")
+
     Note:
         - Automatically cleans markdown syntax (**, *, #, ##, ###)
         - Sanitizes HTML to prevent injection
         - Charts are embedded at 6"x4" size
         - Falls back to error PDF if generation fails
     """
-    buffer = BytesIO()
+    # Spooled buffer: stays in memory for typical reports, spills to
+    # disk for comparison PDFs with several embedded charts
+    buffer = tempfile.SpooledTemporaryFile(max_size=8 * 1024 * 1024)
     doc = SimpleDocTemplate(buffer, pagesize=letter,
                            rightMargin=72, leftMargin=72,
-                           topMargin=72, bottomMargin=18)
+                           topMargin=72, bottomMargin=18,
+                           pageCompression=1)
     
     elements = []
     styles = getSampleStyleSheet()
@@ -149,62 +213,85 @@ def markdown_to_pdf(markdown_text, company_name, chart_paths=None):
         leading=16
     )
     
-    def clean_text(text):
-        """Clean and sanitize text for PDF rendering"""
-        text = re.sub(r'<(?!/?[bi]>)[^>]+>', '', text)
-        text = html.escape(text, quote=False)
-        text = re.sub(r'\*\*(.+?)\*\*', r'<b>\1</b>', text)
-        text = re.sub(r'\*(.+?)\*', r'<i>\1</i>', text)
-        return text
-    
-    lines = markdown_text.split('\n')
-    
-    # Parse markdown and build PDF elements
-    for line in lines:
-        line = line.strip()
-        
+    # One dict lookup on the leading marker per line instead of a chain
+    # of startswith checks: (style, bullet). Vertical gaps come from the
+    # styles' spaceBefore/spaceAfter rather than explicit Spacers.
+    line_styles = {
+        '#': (title_style, False),
+        '##': (heading_style, False),
+        '###': (subheading_style, False),
+        '-': (normal_style, True),
+        '*': (normal_style, True)
+    }
+
+    # Consecutive body/bullet lines fuse into one Paragraph with <br/>
+    # separators, so Platypus lays out one flowable per block instead of
+    # allocating and flowing a Paragraph (plus Spacers) per line
+    body_run = []
+
+    def flush_body():
+        if body_run:
+            elements.append(Paragraph('<br/>'.join(body_run), normal_style))
+            del body_run[:]
+
+    # Parse markdown and build PDF elements (splitlines is the C-level
+    # splitter; iterating it directly skips a named intermediate list)
+    for raw_line in markdown_text.splitlines():
+        line = raw_line.strip()
+
         if not line:
-            elements.append(Spacer(1, 0.15*inch))
+            flush_body()
             continue
-        
-        try:
-            if line.startswith('# '):
-                text = clean_text(line[2:].strip())
-                elements.append(Paragraph(text, title_style))
-                elements.append(Spacer(1, 0.3*inch))
-            elif line.startswith('## '):
-                text = clean_text(line[3:].strip())
-                elements.append(Spacer(1, 0.2*inch))
-                elements.append(Paragraph(text, heading_style))
-            elif line.startswith('### '):
-                text = clean_text(line[4:].strip())
-                elements.append(Paragraph(text, subheading_style))
-            elif line.startswith('---'):
-                elements.append(Spacer(1, 0.2*inch))
-            elif line.startswith('- ') or line.startswith('* '):
-                text = clean_text(line[2:].strip())
-                elements.append(Paragraph(f'• {text}', normal_style))
-            else:
-                text = clean_text(line)
-                if text:
-                    elements.append(Paragraph(text, normal_style))
-        except Exception as e:
+
+        marker, _, rest = line.partition(' ')
+        if marker.startswith('---'):
+            flush_body()
+            elements.append(HRFlowable(width='100%', color='#d1d5db',
+                                       spaceBefore=6, spaceAfter=6))
             continue
+
+        entry = line_styles.get(marker) if rest else None
+        if entry:
+            style, bullet = entry
+            text = _clean_text(rest.strip())
+            if bullet:
+                body_run.append(f'• {text}')
+            else:
+                flush_body()
+                elements.append(Paragraph(text, style))
+        else:
+            text = _clean_text(line)
+            if text:
+                body_run.append(text)
+
+    flush_body()
     
     # Add charts if provided
     if chart_paths:
-        elements.append(Spacer(1, 0.5*inch))
+        elements.append(Spacer(1, _SPACE_LG))
         elements.append(Paragraph('Visual Comparisons', heading_style))
-        elements.append(Spacer(1, 0.3*inch))
-        
-        for chart_type, chart_path in chart_paths.items():
+        elements.append(Spacer(1, _SPACE_MD))
+
+        def resize_or_none(path):
             try:
-                elements.append(Paragraph(f'{chart_type.title()} Chart', subheading_style))
-                img = RLImage(chart_path, width=6*inch, height=4*inch)
-                elements.append(img)
-                elements.append(Spacer(1, 0.3*inch))
-            except Exception as e:
+                return _resized_chart_png(path, os.path.getmtime(path))
+            except Exception:
+                return None
+
+        # Decode and resize every chart in parallel before touching the
+        # flowable list — PIL releases the GIL during decode/resample,
+        # so the per-chart work overlaps across threads
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(4, len(chart_paths))) as executor:
+            resized = dict(zip(chart_paths, executor.map(resize_or_none, chart_paths.values())))
+
+        for chart_type, chart_path in chart_paths.items():
+            png_bytes = resized.get(chart_type)
+            if png_bytes is None:
                 elements.append(Paragraph(f'Chart could not be embedded: {chart_type}', normal_style))
+                continue
+            elements.append(Paragraph(f'{chart_type.title()} Chart', subheading_style))
+            elements.append(RLImage(BytesIO(png_bytes), width=6*inch, height=4*inch))
+            elements.append(Spacer(1, _SPACE_MD))
     
     # Build PDF
     try:
@@ -213,10 +300,10 @@ def markdown_to_pdf(markdown_text, company_name, chart_paths=None):
         return buffer
     except Exception as e:
         buffer = BytesIO()
-        doc = SimpleDocTemplate(buffer, pagesize=letter)
+        doc = SimpleDocTemplate(buffer, pagesize=letter, pageCompression=1)
         error_elements = [
             Paragraph('Error Generating PDF', title_style),
-            Spacer(1, 0.5*inch),
+            Spacer(1, _SPACE_LG),
             Paragraph('Please download the Markdown version instead.', normal_style)
         ]
         doc.build(error_elements)
@@ -224,21 +311,110 @@ def markdown_to_pdf(markdown_text, company_name, chart_paths=None):
         return buffer
 
 
-def analyze_single_company_streamlit(company_name):
+@st.cache_data(show_spinner=False)
+def build_pdf(markdown_text, company_name, chart_items=None):
     """
-    Perform comprehensive analysis of a single company (Streamlit version).
-    
-    This function runs the complete 5-step analysis pipeline with progress
-    indicators optimized for the Streamlit interface:
-    1. Company research
-    2. Competitor identification
-    3. Competitive analysis
-    4. SWOT generation
-    5. Pricing analysis
-    
+    Build the downloadable PDF bytes, cached on the report contents.
+
+    The results view renders on every rerun — any widget click — and an
+    uncached markdown_to_pdf call re-ran the full ReportLab build each
+    time. Caching on (report text, company, chart paths) means the build
+    happens once per report; returning bytes also lets st.download_button
+    serve the payload directly without BytesIO seeks.
+
+    Args:
+        markdown_text (str): Markdown report to convert
+        company_name (str): Company name for the title
+        chart_items (tuple, optional): Hashable (chart_type, path) pairs
+
+    Returns:
+        bytes: Rendered PDF file contents
+    """
+    chart_paths = dict(chart_items) if chart_items else None
+    with markdown_to_pdf(markdown_text, company_name, chart_paths) as buffer:
+        return buffer.read()
+
+
+@st.cache_data(show_spinner=False)
+def load_chart_bytes(path):
+    """
+    Read a chart PNG once and cache the raw bytes.
+
+    The comparison tabs previously decoded each chart with PIL for
+    st.image and re-opened the file again for the download button, on
+    every rerun. Chart filenames are timestamped, so caching on the path
+    is safe; st.image renders raw PNG bytes directly, no decode needed.
+
+    Args:
+        path (str): Chart PNG path
+
+    Returns:
+        bytes: File contents
+    """
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+@st.cache_resource
+def get_agents():
+    """
+    Construct the agent suite once per server process.
+
+    Streamlit reruns this script on every widget interaction, so
+    constructing agents inline repeats their __init__ work each time. st.cache_resource
+    keeps one instance of each agent — and the warm client state they
+    hold — alive across reruns and sessions.
+
+    Returns:
+        SimpleNamespace: researcher, analyst, report, comparison and
+            visual agent instances
+    """
+    return SimpleNamespace(
+        researcher=ResearcherAgent(),
+        analyst=AnalystAgent(),
+        report=ReportGeneratorAgent(),
+        comparison=ComparisonAgent(),
+        visual=VisualGeneratorAgent()
+    )
+
+
+@st.cache_data(ttl=86400, show_spinner=False)
+def cached_research(company_name):
+    """
+    Research a company and its competitors, cached for 24 hours.
+
+    Research is the slowest stage (search + page fetches + Gemini calls)
+    and its inputs are just the company name, so repeated or overlapping
+    names — re-runs, or the same company appearing in several comparisons
+    — reuse the pickled result instead of re-calling the APIs. Only the
+    JSON-able result dicts are cached, never the agent instance.
+
+    Args:
+        company_name (str): Name of the company to research
+
+    Returns:
+        tuple: (company research dict, competitor research dict)
+    """
+    return run_async(get_agents().researcher.aresearch_all(company_name))
+
+
+async def aanalyze_single_company(company_name):
+    """
+    Perform comprehensive analysis of a single company (async pipeline).
+
+    Runs the complete 5-step analysis pipeline with the independent steps
+    overlapped via asyncio.gather:
+    1. Company research + competitor identification (concurrent)
+    2. Competitive analysis + pricing analysis (concurrent)
+    3. SWOT generation (depends on the competitive analysis)
+
+    Since every step is I/O-bound on the Gemini endpoint, each fan-out
+    stage takes roughly the latency of its slowest call instead of the
+    sum of all of them.
+
     Args:
         company_name (str): Name of the company to analyze
-        
+
     Returns:
         dict: Complete company data including all analysis results:
             {
@@ -249,41 +425,295 @@ def analyze_single_company_streamlit(company_name):
                 'swot_analysis': str,
                 'pricing_analysis': str
             }
-            
+
     Raises:
         Exception: If any analysis step fails
-        
+
     Example:
-        >>> data = analyze_single_company_streamlit("Notion")
+        >>> data = await aanalyze_single_company("Notion")
         >>> print(data['swot_analysis'])
     """
-    researcher = ResearcherAgent()
-    analyst = AnalystAgent()
-    
+    analyst = get_agents().analyst
+
     company_data = {'company_name': company_name}
-    
-    with st.spinner('🔍 Researching company...'):
-        company_data['company_research'] = researcher.research_company(company_name)
-    
-    with st.spinner('🏢 Identifying competitors...'):
-        company_data['competitors_research'] = researcher.research_competitors(company_name)
-    
-    with st.spinner('📊 Analyzing competition...'):
-        company_data['competitive_analysis'] = analyst.analyze_competition(
-            company_data['company_research'],
-            company_data['competitors_research']
+
+    # Run the cached research stage in a worker thread so concurrent
+    # company pipelines keep overlapping on a cache miss
+    company_research, competitors_research = await asyncio.to_thread(
+        cached_research, company_name
+    )
+    company_data['company_research'] = company_research
+    company_data['competitors_research'] = competitors_research
+
+    # Price against the identified competitors, not the company itself
+    analyses = await analyst.analyze_all(
+        company_research, competitors_research,
+        extract_competitor_names(competitors_research)
+    )
+    company_data.update(analyses)
+
+    return company_data
+
+
+def analyze_single_company_streamlit(company_name):
+    """
+    Perform comprehensive analysis of a single company (Streamlit version).
+
+    Drives the async pipeline under a single st.status block — with the
+    steps overlapping, per-step spinners would no longer reflect reality.
+
+    Args:
+        company_name (str): Name of the company to analyze
+
+    Returns:
+        dict: Complete company data, see aanalyze_single_company()
+
+    Example:
+        >>> data = analyze_single_company_streamlit("Notion")
+        >>> print(data['swot_analysis'])
+    """
+    with st.status(f'🔍 Analyzing {company_name}...') as status:
+        company_data = run_async(aanalyze_single_company(company_name))
+        status.update(label=f'✅ {company_name} analysis complete', state='complete')
+
+    return company_data
+
+
+async def aanalyze_companies(company_names, on_complete=None):
+    """
+    Analyze several companies concurrently with a bounded fan-out.
+
+    Each company pipeline is fully independent, so all of them run under
+    one event loop instead of back to back — wall time becomes roughly
+    one pipeline rather than N. A semaphore sized from LLM_CONCURRENCY
+    (default 4) caps how many companies are in flight at once so the
+    fan-out stays inside provider rate limits.
+
+    This coroutine runs on the shared Gemini loop thread, which has no
+    Streamlit ScriptRunContext, so it never touches st.* itself — it
+    only reports completions through on_complete and leaves rendering
+    to the script thread (see analyze_companies_with_progress).
+
+    Args:
+        company_names (list): Company names to analyze
+        on_complete: Optional thread-safe callable invoked as each
+            company finishes (in completion order, not input order)
+            with (completed_count, company_name) — e.g. a queue.Queue's
+            put method
+
+    Returns:
+        list: One analysis dict per company, in input order
+
+    Example:
+        >>> companies_data = run_async(aanalyze_companies(['Notion', 'Coda']))
+    """
+    semaphore = asyncio.Semaphore(int(os.getenv('LLM_CONCURRENCY', '4')))
+    results = {}
+
+    async def analyze_one(idx, name):
+        async with semaphore:
+            return idx, await aanalyze_single_company(name)
+
+    completed = 0
+    for task in asyncio.as_completed(
+            [analyze_one(idx, name) for idx, name in enumerate(company_names)]):
+        idx, data = await task
+        results[idx] = data
+        completed += 1
+        if on_complete is not None:
+            on_complete((completed, company_names[idx]))
+
+    return [results[idx] for idx in range(len(company_names))]
+
+
+def analyze_companies_with_progress(company_names, progress_bar):
+    """
+    Drive aanalyze_companies while rendering its progress on this thread.
+
+    st.progress/st.success calls from the Gemini loop thread have no
+    ScriptRunContext and raise NoSessionContext (or are silently dropped
+    on older Streamlit). The script thread would otherwise just block in
+    Future.result(), so instead it polls the future and drains the
+    completion queue, owning every widget update itself.
+
+    Args:
+        company_names (list): Company names to analyze
+        progress_bar: st.progress bar, advanced to 60% as companies finish
+
+    Returns:
+        list: One analysis dict per company, in input order
+    """
+    events = queue.Queue()
+    future = submit_async(aanalyze_companies(company_names, events.put))
+
+    def render(event):
+        completed, name = event
+        progress_bar.progress(int((completed / len(company_names)) * 60))
+        st.success(f'✅ {name} complete')
+
+    while not future.done():
+        try:
+            render(events.get(timeout=0.2))
+        except queue.Empty:
+            pass
+
+    # Events can land between the last drain and the future resolving
+    while not events.empty():
+        render(events.get_nowait())
+
+    return future.result()
+
+
+async def arun_comparison_stage(companies_data):
+    """
+    Run the comparison report and chart generation concurrently.
+
+    The two stages consume the same per-company analysis data but are
+    independent of each other: compare_companies is LLM-bound while
+    generate_all_charts is mostly CPU-bound rendering that already fans
+    out to worker processes. Driving both through run_in_executor keeps
+    the event loop free and collapses the two stages to the wall time of
+    the slower one.
+
+    Args:
+        companies_data (list): Per-company analysis dicts
+
+    Returns:
+        tuple: (comparison_data dict, visual_data dict)
+    """
+    loop = asyncio.get_running_loop()
+    agents = get_agents()
+    return await asyncio.gather(
+        loop.run_in_executor(None, agents.comparison.compare_companies, companies_data),
+        loop.run_in_executor(None, agents.visual.generate_all_charts, companies_data)
+    )
+
+
+@st.fragment
+def render_single_results():
+    """
+    Render the completed single-company report and download buttons.
+
+    Shared between the run that finishes the analysis and later reruns,
+    so the pipeline can fall through to the results directly instead of
+    paying a full st.rerun() script replay. As a fragment, interactions
+    with the widgets inside (download clicks) rerun only this region
+    rather than the whole script.
+    """
+    st.markdown('---')
+    st.markdown('## 📄 Final Report')
+    st.markdown(st.session_state.final_report)
+
+    # Download Buttons
+    st.markdown('---')
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    filename_md = f'{st.session_state.company_name.replace(" ", "_")}_analysis_{timestamp}.md'
+    filename_pdf = f'{st.session_state.company_name.replace(" ", "_")}_analysis_{timestamp}.pdf'
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.download_button(
+            '📄 Download as Markdown',
+            st.session_state.final_report,
+            file_name=filename_md,
+            mime='text/markdown',
+            use_container_width=True,
+            key='download_md_single'
         )
-    
-    with st.spinner('💡 Generating SWOT...'):
-        company_data['swot_analysis'] = analyst.generate_swot(
-            company_data['company_research'],
-            company_data['competitive_analysis']
+
+    with col2:
+        # Deferred: the ReportLab build only runs when the button is
+        # actually clicked (then memoized by build_pdf)
+        st.download_button(
+            '📕 Download as PDF',
+            lambda: build_pdf(st.session_state.final_report, st.session_state.company_name),
+            file_name=filename_pdf,
+            mime='application/pdf',
+            use_container_width=True,
+            key='download_pdf_single'
+        )
+
+
+@st.fragment
+def render_comparison_results():
+    """
+    Render the completed comparison report, chart tabs and downloads.
+
+    Shared between the run that finishes the comparison and later reruns
+    (tab clicks, downloads), mirroring render_single_results(). As a
+    fragment, those interactions rerun only this region rather than the
+    whole script.
+    """
+    st.markdown('---')
+    st.markdown('## 📊 Comparison Report')
+    st.markdown(st.session_state.comparison_data['comparison_analysis'])
+
+    # Display Charts
+    st.markdown('---')
+    st.markdown('## 📈 Visual Comparisons')
+
+    chart_tabs = st.tabs(['🎯 Radar Chart', '📊 Bar Chart', '🔥 Heatmap'])
+
+    # One cached read per chart, shared by st.image and the download
+    # button instead of a PIL decode plus a second file open per tab
+    chart_specs = [
+        ('radar', '📥 Download Radar Chart', 'download_radar'),
+        ('bar', '📥 Download Bar Chart', 'download_bar'),
+        ('heatmap', '📥 Download Heatmap', 'download_heatmap')
+    ]
+
+    for tab, (chart_key, label, button_key) in zip(chart_tabs, chart_specs):
+        with tab:
+            chart_path = st.session_state.visual_data['charts'][chart_key]
+            chart_bytes = load_chart_bytes(chart_path)
+            st.image(chart_bytes, use_container_width=True)
+
+            st.download_button(
+                label,
+                chart_bytes,
+                file_name=chart_path,
+                mime='image/png',
+                use_container_width=True,
+                key=button_key
+            )
+
+    # Download full report
+    st.markdown('---')
+    st.markdown('### 📥 Download Reports')
+
+    report = st.session_state.comparison_report_md
+
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    filename_md = f'comparison_{"_vs_".join([c.replace(" ", "_") for c in st.session_state.comparison_names])}_{timestamp}.md'
+    filename_pdf = f'comparison_{"_vs_".join([c.replace(" ", "_") for c in st.session_state.comparison_names])}_{timestamp}.pdf'
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.download_button(
+            '📄 Download as Markdown',
+            report,
+            file_name=filename_md,
+            mime='text/markdown',
+            use_container_width=True,
+            key='download_md_comparison'
+        )
+
+    with col2:
+        # Deferred: the chart-embedding PDF build only runs on click
+        st.download_button(
+            '📕 Download as PDF (with Charts)',
+            lambda: build_pdf(
+                report,
+                '_vs_'.join(st.session_state.comparison_names),
+                tuple(st.session_state.visual_data['charts'].items())
+            ),
+            file_name=filename_pdf,
+            mime='application/pdf',
+            use_container_width=True,
+            key='download_pdf_comparison'
         )
-    
-    with st.spinner('💰 Analyzing pricing...'):
-        company_data['pricing_analysis'] = analyst.analyze_pricing(company_name, [company_name])
-    
-    return company_data
 
 
 # Initialize session state
@@ -301,6 +731,8 @@ if 'visual_data' not in st.session_state:
     st.session_state.visual_data = None
 if 'comparison_names' not in st.session_state:
     st.session_state.comparison_names = None
+if 'comparison_report_md' not in st.session_state:
+    st.session_state.comparison_report_md = None
 
 # Sidebar
 with st.sidebar:
@@ -320,6 +752,7 @@ with st.sidebar:
         st.session_state.comparison_data = None
         st.session_state.visual_data = None
         st.session_state.comparison_names = None
+        st.session_state.comparison_report_md = None
         st.rerun()
 
 # Header
@@ -345,71 +778,69 @@ if analysis_mode == 'Single Company':
         
         if analyze_button and company_name:
             st.markdown('---')
-            
-            progress_bar = st.progress(0)
-            
+
             try:
-                report_generator = ReportGeneratorAgent()
+                report_generator = get_agents().report
                 all_data = {}
-                
-                # Step 1: Company Research
-                st.info('📊 Step 1/6: Researching Company')
-                progress_bar.progress(15)
-                with st.spinner('Researching...'):
-                    researcher = ResearcherAgent()
-                    all_data['company_research'] = researcher.research_company(company_name)
-                st.success('✅ Company research complete')
-                
-                # Step 2: Competitor Research
-                st.info('🏢 Step 2/6: Identifying Competitors')
-                progress_bar.progress(30)
-                with st.spinner('Finding competitors...'):
-                    all_data['competitors_research'] = researcher.research_competitors(company_name)
-                st.success('✅ Competitors identified')
-                
-                # Step 3: Competitive Analysis
-                st.info('📈 Step 3/6: Analyzing Competition')
-                progress_bar.progress(50)
-                with st.spinner('Analyzing...'):
-                    analyst = AnalystAgent()
+
+                # One st.status container updated in place: a single
+                # widget instead of an info/spinner/success triplet (and
+                # a progress write) per step, so far fewer frontend
+                # messages per run
+                with st.status('🚀 Running analysis...', expanded=True) as status:
+                    # Steps 1-2: Company + Competitor Research (cached,
+                    # and researched concurrently on a miss)
+                    status.update(label='📊 Step 1/6: Researching Company')
+                    company_research, competitors_research = cached_research(company_name)
+                    all_data['company_research'] = company_research
+
+                    status.update(label='🏢 Step 2/6: Identifying Competitors')
+                    all_data['competitors_research'] = competitors_research
+
+                    # Step 3: Competitive Analysis
+                    status.update(label='📈 Step 3/6: Analyzing Competition')
+                    analyst = get_agents().analyst
                     all_data['competitive_analysis'] = analyst.analyze_competition(
                         all_data['company_research'],
                         all_data['competitors_research']
                     )
-                st.success('✅ Competitive analysis complete')
-                
-                # Step 4: SWOT Analysis
-                st.info('💡 Step 4/6: Generating SWOT')
-                progress_bar.progress(65)
-                with st.spinner('Creating SWOT...'):
+
+                    # Step 4: SWOT Analysis
+                    status.update(label='💡 Step 4/6: Generating SWOT')
                     all_data['swot_analysis'] = analyst.generate_swot(
                         all_data['company_research'],
                         all_data['competitive_analysis']
                     )
-                st.success('✅ SWOT analysis complete')
-                
-                # Step 5: Pricing Analysis
-                st.info('💰 Step 5/6: Analyzing Pricing')
-                progress_bar.progress(80)
-                with st.spinner('Analyzing pricing...'):
-                    all_data['pricing_analysis'] = analyst.analyze_pricing(company_name, [company_name])
-                st.success('✅ Pricing analysis complete')
-                
-                # Step 6: Report Generation
-                st.info('📝 Step 6/6: Generating Report')
-                progress_bar.progress(95)
-                with st.spinner('Creating report...'):
-                    final_report = report_generator.generate_final_report(company_name, all_data)
-                
-                progress_bar.progress(100)
-                st.success('✅ Analysis Complete!')
-                
-                # Save to session state
+
+                    # Step 5: Pricing Analysis (against the identified
+                    # competitors, not the company itself)
+                    status.update(label='💰 Step 5/6: Analyzing Pricing')
+                    all_data['pricing_analysis'] = analyst.analyze_pricing(
+                        company_name,
+                        extract_competitor_names(all_data['competitors_research'])
+                    )
+
+                    # Step 6: Report Generation — streamed into the
+                    # status container so the first tokens show up at
+                    # time-to-first-token instead of after the full
+                    # generation; write_stream returns the joined text
+                    status.update(label='📝 Step 6/6: Generating Report')
+                    final_report = st.write_stream(
+                        report_generator.stream_final_report(company_name, all_data)
+                    )
+
+                    # Collapse the box: the results renderer below shows
+                    # the finished report, so the streamed copy inside
+                    # the status container folds away
+                    status.update(label='✅ Analysis Complete!', state='complete',
+                                  expanded=False)
+
+                # Save to session state and fall through to the shared
+                # results renderer — no st.rerun() script replay needed
                 st.session_state.analysis_complete = True
                 st.session_state.final_report = final_report
                 st.session_state.company_name = company_name
-                st.rerun()
-                
+
             except Exception as e:
                 st.error(f'❌ Error: {str(e)}')
                 with st.expander('Error Details'):
@@ -418,40 +849,10 @@ if analysis_mode == 'Single Company':
         elif analyze_button and not company_name:
             st.warning('⚠️ Please enter a company name')
     
-    # Display results if analysis is complete
+    # Display results if analysis is complete (including the run that
+    # just finished, which falls through without an extra rerun)
     if st.session_state.analysis_complete and st.session_state.final_report:
-        st.markdown('---')
-        st.markdown('## 📄 Final Report')
-        st.markdown(st.session_state.final_report)
-        
-        # Download Buttons
-        st.markdown('---')
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        filename_md = f'{st.session_state.company_name.replace(" ", "_")}_analysis_{timestamp}.md'
-        filename_pdf = f'{st.session_state.company_name.replace(" ", "_")}_analysis_{timestamp}.pdf'
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.download_button(
-                '📄 Download as Markdown',
-                st.session_state.final_report,
-                file_name=filename_md,
-                mime='text/markdown',
-                use_container_width=True,
-                key='download_md_single'
-            )
-        
-        with col2:
-            pdf_buffer = markdown_to_pdf(st.session_state.final_report, st.session_state.company_name)
-            st.download_button(
-                '📕 Download as PDF',
-                pdf_buffer,
-                file_name=filename_pdf,
-                mime='application/pdf',
-                use_container_width=True,
-                key='download_pdf_single'
-            )
+        render_single_results()
 
 else:  # Multi-Company Comparison
     
@@ -478,44 +879,30 @@ else:  # Multi-Company Comparison
             progress_bar = st.progress(0)
             
             try:
-                companies_data = []
-                
-                # Analyze each company
-                for idx, company in enumerate(company_names):
-                    st.info(f'Analyzing {company} ({idx+1}/{len(company_names)})')
-                    progress_bar.progress(int((idx / len(company_names)) * 60))
-                    
-                    data = analyze_single_company_streamlit(company)
-                    companies_data.append(data)
-                    
-                    st.success(f'✅ {company} complete')
-                
-                # Generate comparison
-                st.info('📊 Generating comparison report...')
+                # Analyze all companies concurrently (bounded by
+                # LLM_CONCURRENCY); progress advances as each finishes
+                st.info(f'Analyzing {len(company_names)} companies concurrently...')
+                companies_data = analyze_companies_with_progress(company_names, progress_bar)
+
+                # Comparison report (LLM-bound) and charts (CPU-bound)
+                # are independent, so they run concurrently
+                st.info('📊 Generating comparison report and charts...')
                 progress_bar.progress(70)
-                
-                comparison_agent = ComparisonAgent()
-                comparison_data = comparison_agent.compare_companies(companies_data)
-                
-                st.success('✅ Comparison complete')
-                
-                # Generate charts
-                st.info('📈 Creating visual charts...')
-                progress_bar.progress(85)
-                
-                visual_generator = VisualGeneratorAgent()
-                visual_data = visual_generator.generate_all_charts(companies_data)
-                
+
+                comparison_data, visual_data = run_async(arun_comparison_stage(companies_data))
+
                 progress_bar.progress(100)
                 st.success('✅ All visualizations complete!')
                 
                 # Save to session state
+                # Build the downloadable markdown once here rather than
+                # regenerating it on every rerun of the results view
                 st.session_state.comparison_complete = True
                 st.session_state.comparison_data = comparison_data
+                st.session_state.comparison_report_md = get_agents().comparison.generate_comparison_report(comparison_data)
                 st.session_state.visual_data = visual_data
                 st.session_state.comparison_names = company_names
-                st.rerun()
-                
+
             except Exception as e:
                 st.error(f'❌ Error: {str(e)}')
                 with st.expander('Error Details'):
@@ -524,92 +911,10 @@ else:  # Multi-Company Comparison
         elif compare_button:
             st.warning('⚠️ Please enter at least 2 companies')
     
-    # Display results if comparison is complete
+    # Display results if comparison is complete (including the run that
+    # just finished, which falls through without an extra rerun)
     if st.session_state.comparison_complete and st.session_state.comparison_data:
-        st.markdown('---')
-        st.markdown('## 📊 Comparison Report')
-        st.markdown(st.session_state.comparison_data['comparison_analysis'])
-        
-        # Display Charts
-        st.markdown('---')
-        st.markdown('## 📈 Visual Comparisons')
-        
-        tab1, tab2, tab3 = st.tabs(['🎯 Radar Chart', '📊 Bar Chart', '🔥 Heatmap'])
-        
-        with tab1:
-            radar_img = Image.open(st.session_state.visual_data['charts']['radar'])
-            st.image(radar_img, use_container_width=True)
-            
-            with open(st.session_state.visual_data['charts']['radar'], 'rb') as f:
-                st.download_button(
-                    '📥 Download Radar Chart',
-                    f,
-                    file_name=st.session_state.visual_data['charts']['radar'],
-                    mime='image/png',
-                    use_container_width=True,
-                    key='download_radar'
-                )
-        
-        with tab2:
-            bar_img = Image.open(st.session_state.visual_data['charts']['bar'])
-            st.image(bar_img, use_container_width=True)
-            
-            with open(st.session_state.visual_data['charts']['bar'], 'rb') as f:
-                st.download_button(
-                    '📥 Download Bar Chart',
-                    f,
-                    file_name=st.session_state.visual_data['charts']['bar'],
-                    mime='image/png',
-                    use_container_width=True,
-                    key='download_bar'
-                )
-        
-        with tab3:
-            heatmap_img = Image.open(st.session_state.visual_data['charts']['heatmap'])
-            st.image(heatmap_img, use_container_width=True)
-            
-            with open(st.session_state.visual_data['charts']['heatmap'], 'rb') as f:
-                st.download_button(
-                    '📥 Download Heatmap',
-                    f,
-                    file_name=st.session_state.visual_data['charts']['heatmap'],
-                    mime='image/png',
-                    use_container_width=True,
-                    key='download_heatmap'
-                )
-        
-        # Download full report
-        st.markdown('---')
-        st.markdown('### 📥 Download Reports')
-        
-        report = ComparisonAgent().generate_comparison_report(st.session_state.comparison_data)
-        
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        filename_md = f'comparison_{"_vs_".join([c.replace(" ", "_") for c in st.session_state.comparison_names])}_{timestamp}.md'
-        filename_pdf = f'comparison_{"_vs_".join([c.replace(" ", "_") for c in st.session_state.comparison_names])}_{timestamp}.pdf'
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.download_button(
-                '📄 Download as Markdown',
-                report,
-                file_name=filename_md,
-                mime='text/markdown',
-                use_container_width=True,
-                key='download_md_comparison'
-            )
-        
-        with col2:
-            pdf_buffer = markdown_to_pdf(report, '_vs_'.join(st.session_state.comparison_names), st.session_state.visual_data['charts'])
-            st.download_button(
-                '📕 Download as PDF (with Charts)',
-                pdf_buffer,
-                file_name=filename_pdf,
-                mime='application/pdf',
-                use_container_width=True,
-                key='download_pdf_comparison'
-            )
+        render_comparison_results()
 
 # Footer
 st.markdown('---')
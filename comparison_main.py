@@ -1,32 +1,32 @@
 import os
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 from agents.researcher import ResearcherAgent
-from agents.analyst import AnalystAgent
+from agents.analyst import AnalystAgent, extract_competitor_names
 from agents.comparison_agent import ComparisonAgent
 from agents.visual_generator import VisualGeneratorAgent
+from utils.gemini_client import run_async
 
 load_dotenv()
 
-def analyze_single_company(company_name: str) -> dict:
+def analyze_single_company(company_name: str, researcher: ResearcherAgent, analyst: AnalystAgent) -> dict:
     '''Analyze a single company and return all data'''
     print(f'\n{'=' * 60}')
     print(f'Analyzing: {company_name}')
     print('=' * 60)
-    
-    researcher = ResearcherAgent()
-    analyst = AnalystAgent()
-    
+
     company_data = {'company_name': company_name}
     
     try:
-        # Research company
-        print('\n?? Researching company...')
-        company_data['company_research'] = researcher.research_company(company_name)
-        
-        # Research competitors
-        print('?? Identifying competitors...')
-        company_data['competitors_research'] = researcher.research_competitors(company_name)
-        
+        # Research company and competitors concurrently — the two
+        # calls are independent network-bound steps
+        print('\n?? Researching company and identifying competitors...')
+        company_research, competitors_research = run_async(
+            researcher.aresearch_all(company_name)
+        )
+        company_data['company_research'] = company_research
+        company_data['competitors_research'] = competitors_research
+
         # Competitive analysis
         print('?? Analyzing competition...')
         company_data['competitive_analysis'] = analyst.analyze_competition(
@@ -41,9 +41,13 @@ def analyze_single_company(company_name: str) -> dict:
             company_data['competitive_analysis']
         )
         
-        # Pricing analysis
+        # Pricing analysis (against the identified competitors, not the
+        # company itself)
         print('?? Analyzing pricing...')
-        company_data['pricing_analysis'] = analyst.analyze_pricing(company_name, [company_name])
+        company_data['pricing_analysis'] = analyst.analyze_pricing(
+            company_name,
+            extract_competitor_names(company_data['competitors_research'])
+        )
         
         print(f'? Analysis complete for {company_name}')
         return company_data
@@ -81,14 +85,23 @@ def main():
     print(f'\n?? Comparing: {', '.join(companies)}')
     print('=' * 60)
     
-    # Analyze each company
+    # Analyze all companies concurrently with shared agents — the
+    # pipelines are network-bound on LLM calls, so overlapping them
+    # drops wall time from sum-of-companies to roughly max-of-companies
+    researcher = ResearcherAgent()
+    analyst = AnalystAgent()
+
     companies_data = []
-    for company in companies:
-        data = analyze_single_company(company)
-        if data:
-            companies_data.append(data)
-        else:
-            print(f'\n??  Skipping {company} due to errors')
+    with ThreadPoolExecutor(max_workers=len(companies)) as executor:
+        results = executor.map(
+            lambda company: analyze_single_company(company, researcher, analyst),
+            companies
+        )
+        for company, data in zip(companies, results):
+            if data:
+                companies_data.append(data)
+            else:
+                print(f'\n??  Skipping {company} due to errors')
     
     if len(companies_data) < 2:
         print('\n? Need at least 2 companies to compare!')
@@ -1,8 +1,11 @@
-from dotenv import load_dotenv
 import os
 
-load_dotenv()
+if __name__ == "__main__":
+    from dotenv import load_dotenv
 
-print("\n🔍 DEBUGGING ENVIRONMENT\n")
-print("PowerShell env:", os.getenv("GOOGLE_API_KEY"))
-print("Raw env list contains GOOGLE_API_KEY:", "GOOGLE_API_KEY" in os.environ)
+    load_dotenv()
+
+    env_val = os.environ.get("GOOGLE_API_KEY")
+    print("\n🔍 DEBUGGING ENVIRONMENT\n")
+    print("PowerShell env:", env_val)
+    print("Raw env list contains GOOGLE_API_KEY:", env_val is not None)
@@ -13,7 +13,7 @@ Date: November 2025
 import os
 from dotenv import load_dotenv
 from agents.researcher import ResearcherAgent
-from agents.analyst import AnalystAgent
+from agents.analyst import AnalystAgent, extract_competitor_names
 from agents.report_generator import ReportGeneratorAgent
 from agents.comparison_agent import ComparisonAgent
 from agents.visual_generator import VisualGeneratorAgent
@@ -141,7 +141,9 @@ def single_company_analysis():
         memory.add_message('system', 'Starting pricing analysis', 
                           metadata={'step': 5, 'agent': 'AnalystAgent'})
         
-        competitors_list = [company_name]
+        # Price against the identified competitors rather than passing
+        # the company as its own competitor
+        competitors_list = extract_competitor_names(competitors_research)
         pricing_analysis = analyst.analyze_pricing(company_name, competitors_list)
         all_data['pricing_analysis'] = pricing_analysis
         
@@ -155,10 +157,8 @@ def single_company_analysis():
         memory.add_message('system', 'Generating final report', 
                           metadata={'step': 6, 'agent': 'ReportGeneratorAgent'})
         
-        final_report = report_generator.generate_final_report(company_name, all_data)
-        
-        # Save report
-        filename = report_generator.save_report(final_report, company_name)
+        # Generation and file write happen in one streaming pass
+        final_report, filename = report_generator.generate_and_save_report(company_name, all_data)
         
         memory.add_message('agent', f'Report saved: {filename}', 
                           metadata={'step': 6, 'agent': 'ReportGeneratorAgent'})
@@ -293,7 +293,10 @@ def multi_company_comparison():
             )
             
             print('💰 Analyzing pricing...')
-            company_data['pricing_analysis'] = analyst.analyze_pricing(company_name, [company_name])
+            company_data['pricing_analysis'] = analyst.analyze_pricing(
+                company_name,
+                extract_competitor_names(company_data['competitors_research'])
+            )
             
             companies_data.append(company_data)
             print(f'✅ {company_name} analysis complete')
@@ -342,12 +345,15 @@ def multi_company_comparison():
     # Create and save report
     report = comparison_agent.generate_comparison_report(comparison_data)
     
-    # Add chart references to report
-    report += f'\n\n## Visual Comparisons\n\n'
-    report += f'Charts have been generated:\n'
-    for chart_type, chart_path in visual_data['charts'].items():
-        report += f'- **{chart_type.title()} Chart**: `{chart_path}`\n'
-    
+    # Add chart references to report (collect-then-join instead of
+    # repeated string concatenation)
+    chart_lines = [report, '\n\n## Visual Comparisons\n\n', 'Charts have been generated:\n']
+    chart_lines.extend(
+        f'- **{chart_type.title()} Chart**: `{chart_path}`\n'
+        for chart_type, chart_path in visual_data['charts'].items()
+    )
+    report = ''.join(chart_lines)
+
     filename = comparison_agent.save_comparison_report(report, [d['company_name'] for d in companies_data])
     
     memory.store_analysis_result('comparison_report_filename', filename)
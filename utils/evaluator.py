@@ -345,8 +345,10 @@ class AgentEvaluator:
         
         summary = self.get_evaluation_summary()
         
+        # Serialize first, then emit one write() call instead of
+        # json.dump's many small writes to the file handle
         with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(summary, f, indent=2)
+            f.write(json.dumps(summary, indent=2))
         
         return filepath
 
@@ -0,0 +1,186 @@
+"""
+Shared Gemini Client Module
+
+Provides a single process-wide genai.Client so all agents reuse one warm
+HTTP connection pool instead of each agent constructing its own client
+(and paying separate TLS handshakes / losing connection multiplexing).
+
+Author: Ishan
+Course: Google-Kaggle 5-Day AI Agents Intensive Course (Capstone Project)
+Date: December 2025
+"""
+
+import asyncio
+import random
+import threading
+import time
+
+import httpx
+from api_config import GOOGLE_API_KEY
+from google import genai
+from google.genai import errors, types
+
+_client = None
+
+# One long-lived event loop (daemon thread) for all client.aio work.
+# The shared client's async httpx transport holds keep-alive connections
+# that belong to the loop they were opened under; driving them from
+# per-call asyncio.run() loops reuses a connection after its loop is
+# closed ("Event loop is closed") or from two live loops at once.
+_loop = None
+_loop_lock = threading.Lock()
+
+
+def _ensure_loop() -> asyncio.AbstractEventLoop:
+    """Start the shared Gemini event loop on first use and return it."""
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=_loop.run_forever, name='gemini-loop', daemon=True
+            ).start()
+    return _loop
+
+
+def submit_async(coro):
+    """
+    Schedule a coroutine on the shared Gemini event loop without blocking.
+
+    Returns the concurrent.futures.Future for the coroutine so the
+    calling thread can do other work — e.g. drain progress events for
+    the UI — while polling future.done() instead of parking immediately
+    in result().
+
+    Args:
+        coro: Coroutine to execute
+
+    Returns:
+        concurrent.futures.Future: Future resolving to the coroutine's result
+
+    Example:
+        >>> future = submit_async(aanalyze_companies(names, events.put))
+        >>> while not future.done():
+        ...     drain_events()
+        >>> data = future.result()
+    """
+    return asyncio.run_coroutine_threadsafe(coro, _ensure_loop())
+
+
+def run_async(coro):
+    """
+    Run a coroutine to completion on the shared Gemini event loop.
+
+    Drop-in replacement for asyncio.run() in sync wrappers and other
+    blocking callers: the coroutine executes on the single long-lived
+    loop that owns the shared client's async transport, so keep-alive
+    connections are never carried across (or shared between) loops.
+    Safe to call from any thread except the loop thread itself.
+
+    Args:
+        coro: Coroutine to execute
+
+    Returns:
+        Whatever the coroutine returns
+
+    Example:
+        >>> data = run_async(researcher.aresearch_company('Notion'))
+    """
+    return submit_async(coro).result()
+
+# Retry policy for transient Gemini failures (rate limits, server errors).
+# Under concurrent fan-out 429s are expected; backing off and retrying
+# beats restarting the whole pipeline by hand.
+MAX_GEMINI_ATTEMPTS = 6
+_RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+def _is_retryable(exc: Exception) -> bool:
+    """Check whether an exception is a transient Gemini API error."""
+    return isinstance(exc, errors.APIError) and exc.code in _RETRYABLE_STATUS_CODES
+
+
+def _backoff_delay(attempt: int) -> float:
+    """Exponential backoff with jitter, capped at 30 seconds."""
+    return min(30.0, 2.0 ** attempt) * random.uniform(0.5, 1.0)
+
+
+async def call_with_retry_async(call):
+    """
+    Run an async Gemini call, retrying transient failures with backoff.
+
+    Args:
+        call: Zero-argument coroutine function issuing the API call
+
+    Returns:
+        Whatever the call returns on success
+
+    Raises:
+        The last exception if all attempts fail or the error is not
+        transient (4xx other than 429)
+
+    Example:
+        >>> text = await call_with_retry_async(lambda: generate(prompt))
+    """
+    for attempt in range(MAX_GEMINI_ATTEMPTS):
+        try:
+            return await call()
+        except Exception as exc:
+            if not _is_retryable(exc) or attempt == MAX_GEMINI_ATTEMPTS - 1:
+                raise
+            await asyncio.sleep(_backoff_delay(attempt))
+
+
+def call_with_retry(call):
+    """
+    Sync counterpart of call_with_retry_async.
+
+    Args:
+        call: Zero-argument function issuing the API call
+
+    Returns:
+        Whatever the call returns on success
+    """
+    for attempt in range(MAX_GEMINI_ATTEMPTS):
+        try:
+            return call()
+        except Exception as exc:
+            if not _is_retryable(exc) or attempt == MAX_GEMINI_ATTEMPTS - 1:
+                raise
+            time.sleep(_backoff_delay(attempt))
+
+
+def get_client(pool_size: int = 20) -> genai.Client:
+    """
+    Return the shared genai.Client, creating it on first use.
+
+    The client's HTTPX transport (sync and async) is configured with a
+    keepalive connection pool so concurrent agent calls multiplex over
+    warm connections.
+
+    Args:
+        pool_size (int): Maximum pooled connections. Only honored on the
+            first call, when the client is created (default: 20)
+
+    Returns:
+        genai.Client: The shared client instance
+
+    Example:
+        >>> client = get_client()
+        >>> client is get_client()
+        True
+    """
+    global _client
+    if _client is None:
+        limits = httpx.Limits(
+            max_connections=pool_size,
+            max_keepalive_connections=pool_size
+        )
+        _client = genai.Client(
+            api_key=GOOGLE_API_KEY,
+            http_options=types.HttpOptions(
+                client_args={'limits': limits},
+                async_client_args={'limits': limits}
+            )
+        )
+    return _client
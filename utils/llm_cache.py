@@ -0,0 +1,297 @@
+"""
+Gemini Response Cache Module
+
+Provides an opt-in, exact-match disk cache for Gemini responses keyed on
+(model id, prompt hash). Re-running an analysis with overlapping inputs
+(e.g. a comparison with one company added) re-issues identical prompts;
+with the cache enabled those hits return instantly and cost nothing.
+
+The cache is disabled by default because generation is non-deterministic
+and fresh runs are usually wanted. Set GEMINI_CACHE=1 to enable it.
+
+Author: Ishan
+Course: Google-Kaggle 5-Day AI Agents Intensive Course (Capstone Project)
+Date: December 2025
+"""
+
+import os
+import asyncio
+import hashlib
+import math
+import pickle
+from pathlib import Path
+from typing import Optional
+
+# Responses are stored as plain text files under this directory,
+# one file per (model, prompt) pair
+CACHE_DIR = Path('.gemini_cache')
+
+
+def cache_enabled() -> bool:
+    """
+    Check whether response caching is enabled via environment.
+
+    Returns:
+        bool: True if GEMINI_CACHE=1 is set
+
+    Example:
+        >>> os.environ['GEMINI_CACHE'] = '1'
+        >>> cache_enabled()
+        True
+    """
+    return os.getenv('GEMINI_CACHE') == '1'
+
+
+def _cache_path(model_id: str, prompt: str) -> Path:
+    """
+    Compute the cache file path for a (model, prompt) pair.
+
+    Args:
+        model_id (str): Gemini model identifier
+        prompt (str): Full prompt text
+
+    Returns:
+        Path: Cache file path keyed on the blake2b digest of the prompt
+    """
+    digest = hashlib.blake2b(prompt.encode('utf-8')).hexdigest()
+    return CACHE_DIR / f'{model_id}_{digest}.txt'
+
+
+def get_cached_response(model_id: str, prompt: str) -> Optional[str]:
+    """
+    Look up a cached response for this exact (model, prompt) pair.
+
+    Args:
+        model_id (str): Gemini model identifier
+        prompt (str): Full prompt text
+
+    Returns:
+        str or None: Cached response text, or None on miss / cache disabled
+
+    Example:
+        >>> text = get_cached_response('gemini-2.5-flash', prompt)
+        >>> if text is None:
+        ...     text = call_gemini(prompt)
+    """
+    if not cache_enabled():
+        return None
+
+    path = _cache_path(model_id, prompt)
+    if path.exists():
+        return path.read_text(encoding='utf-8')
+    return None
+
+
+def store_response(model_id: str, prompt: str, response_text: str):
+    """
+    Store a response for this exact (model, prompt) pair.
+
+    No-op when caching is disabled.
+
+    Args:
+        model_id (str): Gemini model identifier
+        prompt (str): Full prompt text
+        response_text (str): Response text to cache
+
+    Example:
+        >>> store_response('gemini-2.5-flash', prompt, response.text)
+    """
+    if not cache_enabled():
+        return
+
+    CACHE_DIR.mkdir(exist_ok=True)
+    _cache_path(model_id, prompt).write_text(response_text, encoding='utf-8')
+
+
+# ---------------------------------------------------------------------------
+# Semantic cache: matches re-runs and near-identical prompts (e.g. the same
+# company researched again with slightly different wording) by embedding
+# similarity instead of exact text equality.
+# ---------------------------------------------------------------------------
+
+SEMANTIC_CACHE_PATH = CACHE_DIR / 'semantic_cache.pkl'
+SEMANTIC_THRESHOLD = 0.92
+EMBEDDING_MODEL = 'text-embedding-004'
+
+_semantic_entries = None
+
+
+def _exact_path(namespace: str, key_text: str) -> Path:
+    """
+    Cache file path for the exact-match pre-check layer.
+
+    Keyed on the SHA-256 of the key text, per namespace. This lookup is
+    O(1) and costs no embedding call, so it runs before the semantic
+    layer on every get_or_call.
+    """
+    digest = hashlib.sha256(key_text.encode('utf-8')).hexdigest()
+    return CACHE_DIR / f'{namespace}_{digest}.txt'
+
+
+def _exact_lookup(namespace: str, key_text: str) -> Optional[str]:
+    """Return the exact-match cached response, or None on miss."""
+    path = _exact_path(namespace, key_text)
+    if path.exists():
+        return path.read_text(encoding='utf-8')
+    return None
+
+
+def _exact_store(namespace: str, key_text: str, response: str):
+    """Store a response in the exact-match layer."""
+    CACHE_DIR.mkdir(exist_ok=True)
+    _exact_path(namespace, key_text).write_text(response, encoding='utf-8')
+
+
+def _load_semantic_entries() -> list:
+    """Load the persisted semantic cache entries (lazily, once)."""
+    global _semantic_entries
+    if _semantic_entries is None:
+        if SEMANTIC_CACHE_PATH.exists():
+            with open(SEMANTIC_CACHE_PATH, 'rb') as f:
+                _semantic_entries = pickle.load(f)
+        else:
+            _semantic_entries = []
+    return _semantic_entries
+
+
+def _save_semantic_entries():
+    """Persist the semantic cache entries to disk."""
+    CACHE_DIR.mkdir(exist_ok=True)
+    with open(SEMANTIC_CACHE_PATH, 'wb') as f:
+        pickle.dump(_semantic_entries, f)
+
+
+def _embed(text: str) -> list:
+    """Compute the embedding vector for a cache key text."""
+    from utils.gemini_client import get_client
+
+    response = get_client().models.embed_content(
+        model=EMBEDDING_MODEL,
+        contents=text
+    )
+    return list(response.embeddings[0].values)
+
+
+def _cosine_similarity(a: list, b: list) -> float:
+    """Cosine similarity between two embedding vectors."""
+    dot = sum(x * y for x, y in zip(a, b))
+    norm_a = math.sqrt(sum(x * x for x in a))
+    norm_b = math.sqrt(sum(x * x for x in b))
+    if norm_a == 0 or norm_b == 0:
+        return 0.0
+    return dot / (norm_a * norm_b)
+
+
+def _semantic_lookup(namespace: str, embedding: list, threshold: float) -> Optional[str]:
+    """Return the best cached response above the similarity threshold."""
+    best_response = None
+    best_similarity = threshold
+    for entry in _load_semantic_entries():
+        if entry['namespace'] != namespace:
+            continue
+        similarity = _cosine_similarity(embedding, entry['embedding'])
+        if similarity >= best_similarity:
+            best_similarity = similarity
+            best_response = entry['response']
+    return best_response
+
+
+def _semantic_store(namespace: str, key_text: str, embedding: list, response: str):
+    """Add an entry to the semantic cache and persist it."""
+    _load_semantic_entries().append({
+        'namespace': namespace,
+        'key': key_text,
+        'embedding': embedding,
+        'response': response
+    })
+    _save_semantic_entries()
+
+
+def get_or_call(key_text: str, call_fn, threshold: float = SEMANTIC_THRESHOLD,
+                namespace: str = 'default') -> str:
+    """
+    Return a semantically cached response or invoke the model call.
+
+    Embeds key_text, compares it against stored entries for the same
+    namespace, and returns the cached response on a hit; otherwise runs
+    call_fn and stores its result. Namespacing per function avoids
+    cross-task collisions (a research prompt never matches a report one).
+
+    Args:
+        key_text (str): Text identifying the request (typically the prompt)
+        call_fn (callable): Zero-argument function producing the response text
+        threshold (float): Minimum cosine similarity for a hit (default: 0.92)
+        namespace (str): Cache namespace, usually the calling function name
+
+    Returns:
+        str: Cached or freshly generated response text
+
+    Example:
+        >>> text = get_or_call(prompt, lambda: generate(prompt),
+        ...                    namespace='research_company')
+
+    Note:
+        Disabled (pass-through) unless GEMINI_CACHE=1; embedding failures
+        also fall through to a direct call.
+    """
+    if not cache_enabled():
+        return call_fn()
+
+    # Exact-match pre-check: identical templated prompts hit here without
+    # paying for an embedding
+    exact = _exact_lookup(namespace, key_text)
+    if exact is not None:
+        return exact
+
+    try:
+        embedding = _embed(key_text)
+    except Exception:
+        return call_fn()
+
+    cached = _semantic_lookup(namespace, embedding, threshold)
+    if cached is not None:
+        _exact_store(namespace, key_text, cached)
+        return cached
+
+    response = call_fn()
+    _exact_store(namespace, key_text, response)
+    _semantic_store(namespace, key_text, embedding, response)
+    return response
+
+
+async def get_or_call_async(key_text: str, call_fn, threshold: float = SEMANTIC_THRESHOLD,
+                            namespace: str = 'default') -> str:
+    """
+    Async counterpart of get_or_call for coroutine call functions.
+
+    Args:
+        key_text (str): Text identifying the request (typically the prompt)
+        call_fn (callable): Zero-argument coroutine function producing the
+            response text
+        threshold (float): Minimum cosine similarity for a hit
+        namespace (str): Cache namespace, usually the calling function name
+
+    Returns:
+        str: Cached or freshly generated response text
+    """
+    if not cache_enabled():
+        return await call_fn()
+
+    exact = _exact_lookup(namespace, key_text)
+    if exact is not None:
+        return exact
+
+    try:
+        embedding = await asyncio.to_thread(_embed, key_text)
+    except Exception:
+        return await call_fn()
+
+    cached = _semantic_lookup(namespace, embedding, threshold)
+    if cached is not None:
+        _exact_store(namespace, key_text, cached)
+        return cached
+
+    response = await call_fn()
+    _exact_store(namespace, key_text, response)
+    _semantic_store(namespace, key_text, embedding, response)
+    return response
@@ -10,6 +10,7 @@ Date: December 2025
 """
 
 import json
+from collections import deque
 from datetime import datetime
 from typing import Dict, Any, List, Optional
 from pathlib import Path
@@ -50,7 +51,9 @@ class MemoryManager:
         else:
             self.session_id = f"session_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
         
-        self.conversation_history: List[Dict[str, Any]] = []
+        # deque(maxlen=...) caps the history in O(1) per append instead
+        # of re-slicing the list after every message
+        self.conversation_history: deque = deque(maxlen=max_history_length)
         self.max_history_length = max_history_length
         
         self.session_data: Dict[str, Any] = {
@@ -82,12 +85,8 @@ class MemoryManager:
             'metadata': metadata or {}
         }
         
+        # The deque's maxlen drops the oldest message automatically
         self.conversation_history.append(message)
-        
-        # Trim history if exceeds max length
-        if len(self.conversation_history) > self.max_history_length:
-            self.conversation_history = self.conversation_history[-self.max_history_length:]
-        
         self.session_data['last_updated'] = datetime.now().isoformat()
     
     def get_recent_context(self, max_turns: int = 10) -> List[Dict[str, Any]]:
@@ -104,7 +103,7 @@ class MemoryManager:
             >>> recent = memory.get_recent_context(max_turns=5)
             >>> print(f"Last {len(recent)} messages")
         """
-        return self.conversation_history[-max_turns:]
+        return list(self.conversation_history)[-max_turns:]
     
     def get_context_summary(self) -> str:
         """
@@ -117,13 +116,16 @@ class MemoryManager:
             >>> summary = memory.get_context_summary()
             >>> print(summary)
         """
-        summary = f"Session: {self.session_id}\n"
-        summary += f"Messages: {len(self.conversation_history)}\n\n"
-        
-        for msg in self.conversation_history[-5:]:  # Last 5 messages
-            summary += f"[{msg['role']}] {msg['content'][:100]}...\n"
-        
-        return summary
+        # Collect-then-join builds the summary in one allocation instead
+        # of reallocating the string per message
+        parts = [
+            f"Session: {self.session_id}\n",
+            f"Messages: {len(self.conversation_history)}\n\n"
+        ]
+        for msg in list(self.conversation_history)[-5:]:  # Last 5 messages
+            parts.append(f"[{msg['role']}] {msg['content'][:100]}...\n")
+
+        return ''.join(parts)
     
     def store_analysis_result(self, key: str, value: Any):
         """
@@ -216,11 +218,13 @@ class MemoryManager:
         
         data = {
             'session_data': self.session_data,
-            'conversation_history': self.conversation_history
+            'conversation_history': list(self.conversation_history)
         }
         
+        # Serialize first, then emit one write() call — json.dump with a
+        # file handle issues many small writes per element
         with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2)
+            f.write(json.dumps(data, indent=2))
     
     def load_from_file(self, filepath: str):
         """
@@ -236,7 +240,8 @@ class MemoryManager:
             data = json.load(f)
         
         self.session_data = data['session_data']
-        self.conversation_history = data['conversation_history']
+        self.conversation_history = deque(data['conversation_history'],
+                                          maxlen=self.max_history_length)
         self.session_id = self.session_data['session_id']
     
     def clear_history(self):
@@ -246,7 +251,7 @@ class MemoryManager:
         Example:
             >>> memory.clear_history()
         """
-        self.conversation_history = []
+        self.conversation_history.clear()
     
     def reset_session(self):
         """
@@ -0,0 +1,132 @@
+"""
+Gemini Rate Limiter Module
+
+Provides a shared sliding-window rate limiter for Gemini API calls so the
+pipeline paces itself under the per-minute request and token quotas instead
+of hitting 429s and paying exponential-backoff stalls.
+
+Limits default to 90% of the free-tier quota (100 RPM / 30K TPM) and can be
+switched to paid-tier limits with GEMINI_TIER=paid.
+
+Author: Ishan
+Course: Google-Kaggle 5-Day AI Agents Intensive Course (Capstone Project)
+Date: December 2025
+"""
+
+import os
+import time
+import threading
+from collections import deque
+
+# (requests per minute, tokens per minute) at 90% of the published quota,
+# leaving headroom for estimation error
+_TIER_LIMITS = {
+    'free': (90, 27000),
+    'paid': (900, 900000)
+}
+
+_WINDOW_SECONDS = 60.0
+
+
+class GeminiLimiter:
+    """
+    Sliding-window RPM/TPM limiter shared across agents.
+
+    Tracks request timestamps and estimated token counts over the last
+    60 seconds; acquire() blocks until issuing another request would stay
+    inside both ceilings. Thread-safe, so concurrent agents share one
+    budget.
+
+    Attributes:
+        rpm (int): Maximum requests per minute
+        tpm (int): Maximum estimated tokens per minute
+
+    Example:
+        >>> limiter = get_limiter()
+        >>> limiter.acquire(estimated_tokens=len(prompt) // 4)
+        >>> response = client.models.generate_content(...)
+    """
+
+    def __init__(self, rpm: int, tpm: int):
+        """
+        Initialize the limiter with per-minute ceilings.
+
+        Args:
+            rpm (int): Maximum requests per minute
+            tpm (int): Maximum estimated tokens per minute
+        """
+        self.rpm = rpm
+        self.tpm = tpm
+        self._lock = threading.Lock()
+        self._events = deque()  # (timestamp, estimated_tokens)
+        self._tokens_in_window = 0
+
+    @staticmethod
+    def estimate_tokens(text: str) -> int:
+        """
+        Estimate the token count of a prompt (~4 characters per token).
+
+        Args:
+            text (str): Prompt text
+
+        Returns:
+            int: Estimated token count
+        """
+        return len(text) // 4
+
+    def acquire(self, estimated_tokens: int = 0):
+        """
+        Block until a request with this token estimate fits in the window.
+
+        Args:
+            estimated_tokens (int): Estimated tokens the call will consume
+
+        Note:
+            Sleeps in short increments until the oldest window entries
+            expire; from async code, run this via asyncio.to_thread so
+            the event loop keeps serving other tasks.
+        """
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._prune(now)
+
+                if (len(self._events) < self.rpm
+                        and self._tokens_in_window + estimated_tokens <= self.tpm):
+                    self._events.append((now, estimated_tokens))
+                    self._tokens_in_window += estimated_tokens
+                    return
+
+                # Wait until the oldest event leaves the window
+                delay = self._events[0][0] + _WINDOW_SECONDS - now
+
+            time.sleep(max(delay, 0.1))
+
+    def _prune(self, now: float):
+        """Drop window entries older than 60 seconds."""
+        while self._events and self._events[0][0] <= now - _WINDOW_SECONDS:
+            _, tokens = self._events.popleft()
+            self._tokens_in_window -= tokens
+
+
+_limiter = None
+_limiter_lock = threading.Lock()
+
+
+def get_limiter() -> GeminiLimiter:
+    """
+    Return the shared GeminiLimiter, creating it on first use.
+
+    The tier is read from GEMINI_TIER ('free' or 'paid', default 'free');
+    unknown values fall back to free-tier limits.
+
+    Returns:
+        GeminiLimiter: The process-wide limiter instance
+    """
+    global _limiter
+    with _limiter_lock:
+        if _limiter is None:
+            tier = os.getenv('GEMINI_TIER', 'free').lower()
+            rpm, tpm = _TIER_LIMITS.get(tier, _TIER_LIMITS['free'])
+            _limiter = GeminiLimiter(rpm, tpm)
+        return _limiter
@@ -1,4 +1,5 @@
 import os
+import time
 import requests
 from bs4 import BeautifulSoup
 from serpapi import GoogleSearch
@@ -64,7 +65,26 @@ def search_competitors(company_name: str, num_results: int = 5) -> list:
         return []
 
 
+# Pricing searches repeat across comparison runs (overlapping competitors),
+# so memoize results per normalized name with a TTL since prices change
+_pricing_cache = {}
+_PRICING_CACHE_TTL = 3600  # seconds
+
+
 def search_pricing_info(company_name: str) -> list:
+    """Search for pricing information (cached per company for 1 hour)"""
+    cache_key = company_name.strip().lower()
+    cached = _pricing_cache.get(cache_key)
+    if cached and time.monotonic() - cached[0] < _PRICING_CACHE_TTL:
+        return cached[1]
+
+    results = _search_pricing_info_uncached(company_name)
+    if results:
+        _pricing_cache[cache_key] = (time.monotonic(), results)
+    return results
+
+
+def _search_pricing_info_uncached(company_name: str) -> list:
     """Search for pricing information"""
     try:
         params = {
@@ -93,13 +113,23 @@ def search_pricing_info(company_name: str) -> list:
         return []
 
 
+# One pooled session shared by all webpage fetches: keep-alive reuses
+# TCP/TLS connections across requests instead of paying a handshake per
+# page. The researcher fetches several pages per company from a thread
+# pool, so the pool is sized to cover concurrent fetches.
+_http_session = requests.Session()
+_http_session.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+})
+_http_adapter = requests.adapters.HTTPAdapter(pool_connections=32, pool_maxsize=64)
+_http_session.mount('https://', _http_adapter)
+_http_session.mount('http://', _http_adapter)
+
+
 def fetch_webpage_content(url: str) -> str:
-    """Fetch and parse webpage content"""
+    """Fetch and parse webpage content (shared keep-alive session)"""
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
-        response = requests.get(url, headers=headers, timeout=10)
+        response = _http_session.get(url, timeout=10)
         response.raise_for_status()
         
         soup = BeautifulSoup(response.content, 'lxml')